@@ -17,7 +17,6 @@ import logging
 import os
 
 import click
-import openstack
 import petname  # type: ignore [import-untyped]
 from rich.console import Console
 from snaphelpers import Snap
@@ -56,6 +55,9 @@ def launch(
     name: str | None = None,
 ) -> None:
     """Launch an OpenStack instance on demo setup."""
+    # imported here, the openstack SDK is slow to import
+    import openstack
+
     snap = Snap()
     data_location = snap.paths.user_data
     deployment: Deployment = ctx.obj
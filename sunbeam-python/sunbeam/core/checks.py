@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import base64
+import concurrent.futures
 import enum
 import grp
 import json
@@ -39,21 +40,54 @@ from sunbeam.core.juju import JujuStepHelper
 LOG = logging.getLogger(__name__)
 
 CLUSTERD_SERVICE = "clusterd"
+PREFLIGHT_CHECKS_MAX_WORKERS = 8
+
+
+def _run_independent_checks(checks: Sequence["Check"]) -> list[bool]:
+    """Run independent checks concurrently and wait for all of them."""
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(len(checks), PREFLIGHT_CHECKS_MAX_WORKERS)
+    ) as executor:
+        futures = [executor.submit(check.run) for check in checks]
+        concurrent.futures.wait(futures)
+    return [future.result() for future in futures]
 
 
 def run_preflight_checks(checks: Sequence["Check"], console: Console):
-    """Run preflight checks sequentially.
+    """Run preflight checks.
 
-    Runs each checks, logs whether the check passed or failed.
-    Exits at first failure.
+    Checks run in order, as an earlier check can be a precondition of a
+    later one. Consecutive checks flagged as independent run concurrently,
+    all of them complete before their results are reported in order.
+    Logs whether the check passed or failed. Exits at first failure.
 
     Raise ClickException in case of Result Failures.
     """
-    for check in checks:
-        LOG.debug(f"Starting pre-flight check {check.name}")
-        message = f"{check.description} ... "
-        with console.status(message):
-            if not check.run():
+    index = 0
+    while index < len(checks):
+        group = [checks[index]]
+        index += 1
+        if group[0].independent:
+            while index < len(checks) and checks[index].independent:
+                group.append(checks[index])
+                index += 1
+
+        if len(group) > 1:
+            LOG.debug(
+                "Starting pre-flight checks %s concurrently",
+                ", ".join(check.name for check in group),
+            )
+            with console.status("Running pre-flight checks ... "):
+                results = _run_independent_checks(group)
+        else:
+            check = group[0]
+            LOG.debug(f"Starting pre-flight check {check.name}")
+            message = f"{check.description} ... "
+            with console.status(message):
+                results = [check.run()]
+
+        for check, result in zip(group, results):
+            if not result:
                 raise click.ClickException(check.message)
 
 
@@ -67,6 +101,9 @@ class Check:
     name: str
     description: str
     message: str
+    # Independent checks only inspect the local host and do not rely on an
+    # earlier check passing, they can run concurrently with each other.
+    independent: bool = False
 
     def __init__(self, name: str, description: str = ""):
         """Initialise the Check.
@@ -187,6 +224,8 @@ class DiagnosticsCheck:
 class JujuSnapCheck(Check):
     """Check if juju snap is installed or not."""
 
+    independent = True
+
     def __init__(self):
         super().__init__(
             "Check for juju snap",
@@ -208,6 +247,8 @@ class JujuSnapCheck(Check):
 class SshKeysConnectedCheck(Check):
     """Check if ssh-keys interface is connected or not."""
 
+    independent = True
+
     def __init__(self):
         super().__init__(
             "Check for ssh-keys interface",
@@ -292,6 +333,8 @@ class DaemonGroupCheck(Check):
 class LocalShareCheck(Check):
     """Check if ~/.local/share exists."""
 
+    independent = True
+
     def __init__(self):
         super().__init__(
             "Check for .local/share directory",
@@ -410,6 +453,8 @@ class VerifyHypervisorHostnameCheck(Check):
 class SystemRequirementsCheck(Check):
     """Check if machine has minimum 4 cores and 16GB RAM."""
 
+    independent = True
+
     def __init__(self):
         super().__init__(
             "Check for system requirements",
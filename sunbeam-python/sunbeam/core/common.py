@@ -233,10 +233,32 @@ class BaseStep:
             status.update(self.status + msg)
 
 
+def prefetch_plan_models(plan: Sequence[BaseStep]):
+    """Warm the juju model connections used by the steps of a plan.
+
+    Prefetching is best effort: failures are logged and left to the steps,
+    which report them with their own result.
+    """
+    from sunbeam.core.juju import JujuHelper, run_sync
+
+    models: dict[int, tuple[JujuHelper, list[str]]] = {}
+    for step in plan:
+        jhelper = getattr(step, "jhelper", None)
+        model = getattr(step, "model", None)
+        if isinstance(jhelper, JujuHelper) and isinstance(model, str):
+            models.setdefault(id(jhelper), (jhelper, []))[1].append(model)
+    for jhelper, names in models.values():
+        try:
+            run_sync(jhelper.prefetch(names))
+        except Exception as e:
+            LOG.debug("Failed to prefetch models %s: %s", ", ".join(names), str(e))
+
+
 def run_plan(
     plan: Sequence[BaseStep],
     console: Console,
     no_hint: bool = True,
+    prefetch: bool = False,
 ) -> dict:
     """Run plans sequentially.
 
@@ -244,10 +266,16 @@ def run_plan(
     the plan and returns a dictionary of results
     from each step.
 
+    When prefetch is set, the juju model connections used by the steps
+    are warmed in parallel first. Only worth it for plans whose steps
+    run against existing models.
+
     Raise ClickException in case of Result Failures.
     """
     results = {}
 
+    if prefetch:
+        prefetch_plan_models(plan)
     for step in plan:
         LOG.debug(f"Starting step {step.name!r}")
         with console.status(step.status) as status:
@@ -424,6 +452,24 @@ async def update_status_background(
     return asyncio.create_task(_update_status_background_coro())
 
 
+def cancel_status_background(task: asyncio.Task) -> None:
+    """Cancel a task returned by update_status_background.
+
+    The task lives on the event loop that created it, usually the run_sync
+    loop thread, and asyncio tasks are not thread-safe: the cancellation is
+    scheduled on the task's own loop.
+    """
+    loop = task.get_loop()
+    if loop.is_closed():
+        return
+
+    def _cancel():
+        if not task.done():
+            task.cancel()
+
+    loop.call_soon_threadsafe(_cancel)
+
+
 def str_presenter(dumper: yaml.Dumper | yaml.SafeDumper, data: str) -> yaml.ScalarNode:
     """Return multiline string as '|' literal block.
 
@@ -15,35 +15,49 @@
 
 import asyncio
 import asyncio.queues
+import atexit
 import base64
+import collections
+import concurrent.futures
 import contextlib
+import dataclasses
+import functools
 import json
 import logging
 import os
+import re
 import subprocess
-import tempfile
+import threading
+import time
 import typing
+import weakref
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     AsyncGenerator,
     Awaitable,
+    Callable,
     Dict,
     Iterable,
+    Iterator,
     TypedDict,
     TypeVar,
     cast,
 )
 
+import orjson
 import pydantic
+import websockets
 import yaml
 from juju import utils as juju_utils
 from juju.application import Application
 from juju.charmhub import CharmHub
 from juju.client import client as juju_client
+from juju.client.facade import Type as JujuType
 from juju.controller import Controller
 from juju.errors import (
     JujuAPIError,
+    JujuConnectionError,
     JujuError,
 )
 from juju.machine import Machine
@@ -57,6 +71,19 @@ from sunbeam.clusterd.client import Client
 from sunbeam.core.common import SunbeamException
 from sunbeam.versions import JUJU_BASE, SUPPORTED_RELEASE
 
+
+def _json_loads(data: str | bytes) -> typing.Any:
+    return orjson.loads(data)
+
+
+def _json_dumps(obj: typing.Any) -> str:
+    return orjson.dumps(obj).decode("utf-8")
+
+
+# Prefer libyaml bindings when available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 if TYPE_CHECKING:  # pragma: no cover
     # import private def only for type checking
     from juju.client import _definitions as juju_def
@@ -68,17 +95,366 @@ CONTROLLER = "sunbeam-controller"
 JUJU_CONTROLLER_KEY = "JujuController"
 ACCOUNT_FILE = "account.yaml"
 OWNER_TAG_PREFIX = "user-"
+# Seconds a cached model connection can stay unused before being recycled
+MODEL_CACHE_IDLE_TIMEOUT = 300
+SECRET_URI_PREFIX = "secret:"
+# Unit names are application/id, application names start with a letter
+_UNIT_NAME_RE = re.compile(r"(?P<app>[a-z][a-z0-9-]*)/(?P<id>[0-9]+)")
+# Offer URLs are [controller:][owner/]model.offer, optionally followed by
+# :endpoint when used as an integration endpoint
+_OFFER_URL_RE = re.compile(
+    r"(?:(?P<controller>[^:/.]+):)?(?:(?P<owner>[^:/.]+)/)?"
+    r"(?P<model>[^:/.]+)\.(?P<offer>[^:/.]+)(?::(?P<endpoint>[^:/.]+))?"
+)
+# Seconds a model snapshot is reused by read-only charm lookups
+SNAPSHOT_MAX_AGE = 5
+# Channel risks, from the most to the least stable
+CHANNEL_RISK_ORDER = {"stable": 0, "candidate": 1, "beta": 2, "edge": 3}
 
 
 T = TypeVar("T")
 
 
+class _LoopThread:
+    """Event loop running forever in a daemon thread.
+
+    Sync code paths submit coroutines to this loop through run_sync. Keeping a
+    single running loop avoids creating a loop per call and lets connections
+    and their background tasks (pinger, receiver) live between calls.
+    """
+
+    _instance: "_LoopThread | None" = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self._run, name="sunbeam-asyncio", daemon=True
+        )
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @classmethod
+    def get(cls) -> "_LoopThread":
+        """Return the loop thread, starting it on first use."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.shutdown)
+            return cls._instance
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """Run coroutine in the loop thread and wait for its result."""
+        if threading.current_thread() is self.thread:
+            raise RuntimeError("run_sync cannot be called from the event loop")
+
+        async def _await() -> T:
+            return await coro
+
+        future = asyncio.run_coroutine_threadsafe(_await(), self.loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def shutdown(self, timeout: float = 10):
+        """Disconnect remaining controllers and stop the loop."""
+        future = asyncio.run_coroutine_threadsafe(close_all_controllers(), self.loop)
+        try:
+            future.result(timeout)
+        except Exception as e:
+            LOG.debug("Failed to disconnect controllers: %s", str(e))
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout)
+
+
+# Maximum number of connected controllers kept in the pool
+CONTROLLER_POOL_SIZE = 8
+# Controllers connected through JujuController.to_controller,
+# keyed by (api endpoints, user)
+_CONTROLLER_POOL: dict[tuple[tuple[str, ...], str], Controller] = {}
+# Number of users of each pooled controller, only unused ones are evicted
+_CONTROLLER_REFS: collections.Counter[Controller] = collections.Counter()
+# Connections in progress, concurrent callers wait for the same connection
+_CONTROLLER_CONNECTING: dict[
+    tuple[tuple[str, ...], str], concurrent.futures.Future[Controller]
+] = {}
+_CONTROLLER_POOL_LOCK = threading.Lock()
+
+
+# Lifetime of a controller config loaded from clusterd, in seconds
+CONTROLLER_CONFIG_TTL = 60
+# Controller configs loaded through JujuController.load, keyed by id(client)
+_CONTROLLER_CONFIG_CACHE: dict[int, tuple[Client, float, "JujuController"]] = {}
+
+
+async def close_all_controllers():
+    """Disconnect all pooled controllers."""
+    with _CONTROLLER_POOL_LOCK:
+        controllers = list(_CONTROLLER_POOL.values())
+        _CONTROLLER_POOL.clear()
+        _CONTROLLER_REFS.clear()
+    if controllers:
+        LOG.debug("Disconnecting %d juju controllers", len(controllers))
+    await asyncio.gather(
+        *(c.disconnect() for c in controllers if c.is_connected()),
+        return_exceptions=True,
+    )
+
+
+def _evict_unused_controllers() -> list[Controller]:
+    """Drop the least recently used unused controllers above the pool size.
+
+    Must be called with _CONTROLLER_POOL_LOCK held, the evicted controllers
+    are returned to be disconnected once the lock is released.
+    """
+    evicted = []
+    for key, controller in list(_CONTROLLER_POOL.items()):
+        if len(_CONTROLLER_POOL) <= CONTROLLER_POOL_SIZE:
+            break
+        if _CONTROLLER_REFS[controller] == 0:
+            del _CONTROLLER_POOL[key]
+            del _CONTROLLER_REFS[controller]
+            evicted.append(controller)
+    return evicted
+
+
+async def release_controller(controller: Controller):
+    """Release a controller returned by JujuController.to_controller.
+
+    Pooled controllers stay connected for the next user, controllers that are
+    not pooled, or no longer, are disconnected once unused.
+    """
+    with _CONTROLLER_POOL_LOCK:
+        if _CONTROLLER_REFS[controller] > 0:
+            _CONTROLLER_REFS[controller] -= 1
+        in_use = _CONTROLLER_REFS[controller] > 0
+        pooled = controller in _CONTROLLER_POOL.values()
+        if not pooled and not in_use:
+            del _CONTROLLER_REFS[controller]
+        evicted = _evict_unused_controllers()
+    if not pooled and not in_use:
+        evicted.append(controller)
+    await asyncio.gather(
+        *(c.disconnect() for c in evicted if c.is_connected()),
+        return_exceptions=True,
+    )
+
+
+async def discard_controller(controller: Controller):
+    """Drop a controller from the pool and disconnect it.
+
+    For controllers going away, e.g. destroyed or replaced by a new bootstrap,
+    other users of the controller lose their connection as well.
+    """
+    with _CONTROLLER_POOL_LOCK:
+        for key, pooled in list(_CONTROLLER_POOL.items()):
+            if pooled is controller:
+                del _CONTROLLER_POOL[key]
+        del _CONTROLLER_REFS[controller]
+    if controller.is_connected():
+        await controller.disconnect()
+
+
 def run_sync(coro: Awaitable[T]) -> T:
     """Helper to run coroutines synchronously."""
-    result = asyncio.get_event_loop().run_until_complete(coro)
+    result = _LoopThread.get().run(coro)
     return cast(T, result)
 
 
+def _facade(cls: typing.Any, connection: typing.Any) -> typing.Any:
+    """Return the facade of a connection, built once per connection.
+
+    Facades are stored on the connection itself so they share its lifetime.
+    """
+    facades = connection.__dict__.setdefault("_sunbeam_facades", {})
+    facade = facades.get(cls)
+    if facade is None:
+        facade = facades[cls] = cls.from_connection(connection)
+    return facade
+
+
+# Interval between status checks when no model change is observed, in seconds
+STATUS_POLL_INTERVAL = 15
+# Bounds of the backoff between checks of a model removal, in seconds
+MODEL_GONE_POLL_INTERVAL = 0.5
+MODEL_GONE_POLL_MAX_INTERVAL = 5
+
+
+class _ModelWatch:
+    """Broadcast application, unit and machine changes of a model to waiters.
+
+    Waiters grab a change event before checking their condition, so changes
+    happening while the condition is evaluated are not missed.
+
+    Status requests issued in the same loop iteration, typically by waiters
+    woken by the same change, are coalesced into a single get_status call.
+    """
+
+    ENTITIES = ("application", "unit", "machine")
+
+    def __init__(self, model: Model):
+        self._listeners: dict[str, list[asyncio.Event]] = {}
+        self._apps: set[str] = set()
+        self._pending: asyncio.Future | None = None
+        self._task: asyncio.Task | None = None
+        model.add_observer(
+            self._on_change, predicate=lambda delta: delta.entity in self.ENTITIES
+        )
+
+    def changed(self, *entities: str) -> asyncio.Event:
+        """Return an event set on the next change of any of the entity types."""
+        event = asyncio.Event()
+        for entity in entities:
+            self._listeners.setdefault(entity, []).append(event)
+        return event
+
+    async def _on_change(self, delta, old, new, model):
+        for event in self._listeners.pop(delta.entity, []):
+            event.set()
+
+    async def get_status(self, model: Model, app: str) -> "juju_def.FullStatus":
+        """Get the status of the model, filtered on app and concurrent requests."""
+        self._apps.add(app)
+        if self._pending is None:
+            self._pending = asyncio.get_running_loop().create_future()
+            # Retrieve the exception even if every requester got cancelled
+            self._pending.add_done_callback(
+                lambda future: future.cancelled() or future.exception()
+            )
+            self._task = asyncio.create_task(self._fetch(model, self._pending))
+        return await asyncio.shield(self._pending)
+
+    async def _fetch(self, model: Model, future: asyncio.Future):
+        # Let the other requesters of this loop iteration register
+        await asyncio.sleep(0)
+        apps, self._apps, self._pending = sorted(self._apps), set(), None
+        try:
+            future.set_result(await model.get_status(apps))
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+
+    @staticmethod
+    async def wait(event: asyncio.Event, timeout: float):
+        """Wait for a change signaled on event, at most timeout seconds."""
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+_MODEL_WATCHES: "weakref.WeakKeyDictionary[Model, _ModelWatch]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _model_watch(model: Model) -> _ModelWatch:
+    """Return the watch of a model, registering it on first use."""
+    watch = _MODEL_WATCHES.get(model)
+    if watch is None:
+        watch = _MODEL_WATCHES[model] = _ModelWatch(model)
+    return watch
+
+
+async def _wait_for_condition(
+    model: Model,
+    condition: Callable[[], bool],
+    entities: Iterable[str],
+    timeout: float | None = None,
+):
+    """Wait for condition, evaluating it only when the given entities change.
+
+    :model: Model object
+    :condition: Predicate on the model state
+    :entities: Entity types the predicate depends on
+    :timeout: Waiting timeout in seconds
+    :raises asyncio.TimeoutError: when the condition is not met in time
+    """
+    watch = _model_watch(model)
+    entities = tuple(entities)
+
+    async def _wait():
+        while True:
+            changed = watch.changed(*entities)
+            if condition():
+                return
+            await changed.wait()
+
+    await asyncio.wait_for(_wait(), timeout)
+
+
+@contextlib.contextmanager
+def _snap_home() -> Iterator[None]:
+    """Point HOME to the real home of the snap user within the context."""
+    old_home = os.environ.get("HOME")
+    os.environ["HOME"] = os.environ["SNAP_REAL_HOME"]
+    try:
+        yield
+    finally:
+        if old_home is None:
+            os.environ.pop("HOME", None)
+        else:
+            os.environ["HOME"] = old_home
+
+
+def _is_offer_url(*endpoints: str) -> bool:
+    """Whether any of the endpoints is an offer URL, e.g. controller:admin/m.app."""
+    return any(_OFFER_URL_RE.fullmatch(endpoint) for endpoint in endpoints)
+
+
+@functools.cache
+def _juju_binary() -> str:
+    """Path of the juju binary shipped in the snap, constant for the process."""
+    return str(Snap().paths.snap / "juju" / "bin" / "juju")
+
+
+@functools.cache
+def _snap_user_data() -> Path:
+    """User data directory of the snap, constant for the process."""
+    return Snap().paths.user_data
+
+
+@functools.lru_cache(maxsize=64)
+def _decode_b64(data: str) -> str:
+    """Decode base64 encoded kubeconfig data, cached for repeated refreshes."""
+    return base64.b64decode(data).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=128)
+def _normalise_channel(channel: str) -> str:
+    """Expand a risk-only channel to latest/{risk}, cached per channel string."""
+    if channel in CHANNEL_RISK_ORDER:
+        return f"latest/{channel}"
+    return channel
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_track_version(track: str) -> version.Version:
+    """Parse a channel track as a version, cached per track string."""
+    return version.parse(track)
+
+
+def _to_primitive(obj: typing.Any) -> typing.Any:
+    """Convert juju client types to dict of primitives.
+
+    Equivalent to json.loads(obj.to_json()) without the JSON round-trip.
+    """
+    if isinstance(obj, JujuType):
+        obj = obj.serialize()
+    if isinstance(obj, dict):
+        return {key: _to_primitive(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_primitive(value) for value in obj]
+    return obj
+
+
 class JujuException(SunbeamException):
     """Main juju exception, to be subclassed."""
 
@@ -183,6 +559,137 @@ class ChannelUpdate(TypedDict):
     expected_status: dict[str, list[str]]
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class KubeconfigIndex:
+    """Lookup tables of a kubeconfig, keyed by name.
+
+    contexts: Contexts of the kubeconfig
+    clusters: Clusters of the kubeconfig
+    users: Users of the kubeconfig
+    current: Current context of the kubeconfig
+    """
+
+    contexts: dict
+    clusters: dict
+    users: dict
+    current: dict
+
+    @classmethod
+    def from_kubeconfig(cls, kubeconfig: "dict | KubeconfigIndex") -> "KubeconfigIndex":
+        """Build the index of a kubeconfig, indexes are returned as is."""
+        if isinstance(kubeconfig, KubeconfigIndex):
+            return kubeconfig
+        contexts = {v["name"]: v["context"] for v in kubeconfig["contexts"]}
+        return cls(
+            contexts=contexts,
+            clusters={v["name"]: v["cluster"] for v in kubeconfig["clusters"]},
+            users={v["name"]: v["user"] for v in kubeconfig["users"]},
+            current=contexts.get(kubeconfig.get("current-context"), {}),
+        )
+
+    @property
+    def cluster(self) -> dict:
+        """Cluster of the current context."""
+        return self.clusters.get(self.current.get("cluster"), {})
+
+    @property
+    def user(self) -> dict:
+        """User of the current context."""
+        return self.users.get(self.current.get("user"), {})
+
+
+@dataclasses.dataclass(frozen=True)
+class ModelSnapshot:
+    """Model status fetched with a single FullStatus call.
+
+    Allows callers needing several pieces of information about a model to
+    query the controller once.
+
+    name: Name of the model
+    status: Model status, as returned by JujuHelper.get_model_status
+    fetched_at: Monotonic time the status was fetched at
+    """
+
+    name: str
+    status: dict
+    fetched_at: float = dataclasses.field(default_factory=time.monotonic, compare=False)
+
+    @property
+    def applications(self) -> dict[str, dict]:
+        """Applications status, keyed by application name."""
+        return self.status.get("applications") or {}
+
+    @property
+    def machines(self) -> dict[str, dict]:
+        """Machines status, keyed by machine id."""
+        return self.status.get("machines") or {}
+
+    def application_names(self) -> list[str]:
+        """Return application names in the model."""
+        return list(self.applications.keys())
+
+    def units(self, name: str) -> dict[str, dict]:
+        """Return units status of an application, including subordinates.
+
+        :name: Application name
+        """
+        application = self.applications.get(name)
+        if application is None:
+            raise ApplicationNotFoundException(
+                f"Application missing from model: {self.name!r}"
+            )
+        if not application.get("subordinate-to"):
+            return application.get("units") or {}
+        prefix = f"{name}/"
+        units = {}
+        for principal in self.applications.values():
+            for unit in (principal.get("units") or {}).values():
+                for sub_name, sub in (unit.get("subordinates") or {}).items():
+                    if sub_name.startswith(prefix):
+                        units[sub_name] = {**sub, "machine": unit.get("machine")}
+        return units
+
+    def _leader(self, name: str) -> tuple[str, dict]:
+        for unit_name, unit in self.units(name).items():
+            if unit.get("leader"):
+                return unit_name, unit
+        raise LeaderNotFoundException(
+            f"Leader for application {name!r} is missing from model {self.name!r}"
+        )
+
+    def leader_unit(self, name: str) -> str:
+        """Return leader unit name of an application.
+
+        :name: Application name
+        """
+        return self._leader(name)[0]
+
+    def leader_unit_machine(self, name: str) -> str:
+        """Return machine id of the leader unit of an application.
+
+        :name: Application name
+        """
+        return self._leader(name)[1]["machine"]
+
+    def are_integrated(self, provider: str, requirer: str, relation: str) -> bool:
+        """Check if two applications are integrated.
+
+        Does not support different relation names on provider and requirer.
+        """
+        apps = (provider, requirer)
+        for rel in self.status.get("relations") or []:
+            endpoints = rel.get("endpoints") or []
+            if len(endpoints) != 2:
+                # skip peer relationship
+                continue
+            if all(
+                ep.get("application") in apps and ep.get("name") == relation
+                for ep in endpoints
+            ):
+                return True
+        return False
+
+
 class JujuAccount(pydantic.BaseModel):
     user: str
     password: str
@@ -199,7 +706,7 @@ class JujuAccount(pydantic.BaseModel):
         data_file = data_location / account_file
         try:
             with data_file.open() as file:
-                return JujuAccount(**yaml.safe_load(file))
+                return JujuAccount(**yaml.load(file, Loader=_YAML_LOADER))  # noqa: S506
         except FileNotFoundError as e:
             raise JujuAccountNotFound(
                 "Juju user account not found, is node part of sunbeam "
@@ -213,7 +720,7 @@ class JujuAccount(pydantic.BaseModel):
             data_file.touch()
         data_file.chmod(0o660)
         with data_file.open("w") as file:
-            yaml.safe_dump(self.to_dict(), file)
+            yaml.dump(self.to_dict(), file, Dumper=_YAML_DUMPER)
 
 
 class JujuController(pydantic.BaseModel):
@@ -228,25 +735,82 @@ class JujuController(pydantic.BaseModel):
 
     @classmethod
     def load(cls, client: Client) -> "JujuController":
-        """Load controller from clusterd."""
+        """Load controller from clusterd.
+
+        Loaded configs are cached per client for CONTROLLER_CONFIG_TTL seconds.
+        """
+        cached = _CONTROLLER_CONFIG_CACHE.get(id(client))
+        if (
+            cached is not None
+            and cached[0] is client
+            and time.monotonic() - cached[1] < CONTROLLER_CONFIG_TTL
+        ):
+            return cached[2]
         controller = client.cluster.get_config(JUJU_CONTROLLER_KEY)
-        return JujuController(**json.loads(controller))
+        juju_controller = JujuController(**_json_loads(controller))
+        _CONTROLLER_CONFIG_CACHE[id(client)] = (
+            client,
+            time.monotonic(),
+            juju_controller,
+        )
+        return juju_controller
 
     def write(self, client: Client):
         """Dump self to clusterd."""
-        client.cluster.update_config(JUJU_CONTROLLER_KEY, json.dumps(self.to_dict()))
+        _CONTROLLER_CONFIG_CACHE.pop(id(client), None)
+        client.cluster.update_config(JUJU_CONTROLLER_KEY, _json_dumps(self.to_dict()))
 
     def to_controller(self, juju_account: JujuAccount) -> Controller:
-        """Return connected controller."""
+        """Return connected controller.
+
+        Connected controllers are pooled per endpoints and user, a pooled
+        controller is returned as long as it is still connected. Callers
+        hand the controller back with release_controller.
+        """
+        key = (tuple(self.api_endpoints), juju_account.user)
+        while True:
+            with _CONTROLLER_POOL_LOCK:
+                controller = _CONTROLLER_POOL.pop(key, None)
+                if controller is not None and controller.is_connected():
+                    # Re-insert to keep the pool ordered by last use
+                    _CONTROLLER_POOL[key] = controller
+                    _CONTROLLER_REFS[controller] += 1
+                    return controller
+                connecting = _CONTROLLER_CONNECTING.get(key)
+                if connecting is None:
+                    connecting = concurrent.futures.Future()
+                    _CONTROLLER_CONNECTING[key] = connecting
+                    break
+            if threading.current_thread() is _LoopThread.get().thread:
+                raise RuntimeError("Cannot wait for a connection from the event loop")
+            # Another thread is connecting, look the pool up again once done
+            connecting.result()
+
         controller = Controller()
-        run_sync(
-            controller.connect(
-                endpoint=self.api_endpoints,
-                cacert=self.ca_cert,
-                username=juju_account.user,
-                password=juju_account.password,
+        try:
+            run_sync(
+                controller.connect(
+                    endpoint=self.api_endpoints,
+                    cacert=self.ca_cert,
+                    username=juju_account.user,
+                    password=juju_account.password,
+                )
             )
-        )
+        except BaseException as e:
+            with _CONTROLLER_POOL_LOCK:
+                del _CONTROLLER_CONNECTING[key]
+            connecting.set_exception(e)
+            raise
+
+        with _CONTROLLER_POOL_LOCK:
+            del _CONTROLLER_CONNECTING[key]
+            _CONTROLLER_POOL[key] = controller
+            _CONTROLLER_REFS[controller] += 1
+            evicted = _evict_unused_controllers()
+        connecting.set_result(controller)
+        for evicted_controller in evicted:
+            if evicted_controller.is_connected():
+                run_sync(evicted_controller.disconnect())
         return controller
 
 
@@ -256,13 +820,33 @@ class JujuHelper:
     def __init__(self, controller: Controller):
         self.controller = controller
         self.model_connectors: list[Model] = []
-
-    async def disconnect(self):
-        """Disconnect all connections to juju controller."""
+        self._model_cache: dict[str, tuple[Model, float]] = {}
+        self._model_locks: dict[str, asyncio.Lock] = {}
+        self._model_refs: collections.Counter[Model] = collections.Counter()
+        self._inflight: dict[tuple[str, ...], asyncio.Future] = {}
+        self._snapshots: dict[str, ModelSnapshot] = {}
+        self._authorized_keys: str | None = None
+
+    async def disconnect(self, discard: bool = False):
+        """Disconnect all connections to juju controller.
+
+        :discard: Drop the controller from the pool and disconnect it, instead
+            of keeping it connected for its next user
+        """
         LOG.debug("Disconnecting juju controller and model connections")
+        await self.aclose()
         for model in self.model_connectors:
             await model.disconnect()
-        await self.controller.disconnect()
+        if discard:
+            await discard_controller(self.controller)
+        else:
+            await release_controller(self.controller)
+
+    async def aclose(self):
+        """Disconnect all cached model connections."""
+        cached_models = list(self._model_cache)
+        for model in cached_models:
+            await self._evict_model(model)
 
     async def get_clouds(self) -> dict:
         """Return clouds available on controller."""
@@ -274,9 +858,30 @@ class JujuHelper:
         models = await self.controller.list_models()
         return models
 
+    async def _dedupe(
+        self, key: tuple[str, ...], factory: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Share the result of identical concurrent calls.
+
+        The first caller runs the coroutine, concurrent callers with the same
+        key await the same result instead of issuing another request.
+
+        :key: Key identifying the call
+        :factory: Callable returning the coroutine to run
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
     async def get_model(self, model: str) -> Model:
         """Fetch model.
 
+        Each call returns a new connection owned by the caller, use
+        get_model_closing to share a connection between concurrent users.
+
         :model: Name of the model
         """
         try:
@@ -288,22 +893,89 @@ class JujuHelper:
                 raise ModelNotFoundException(f"Model {model!r} not found")
             raise e
 
+    async def _get_cached_model(self, model: str) -> Model:
+        """Fetch model from the connection cache, connecting on miss.
+
+        Cached connections idle for more than MODEL_CACHE_IDLE_TIMEOUT seconds
+        are recycled unless in use, connections no longer connected always are.
+
+        :model: Name of the model
+        """
+        lock = self._model_locks.setdefault(model, asyncio.Lock())
+        async with lock:
+            cached = self._model_cache.get(model)
+            if cached is not None:
+                model_impl, last_used = cached
+                idle = time.monotonic() - last_used
+                in_use = self._model_refs[model_impl] > 0
+                if (in_use or idle < MODEL_CACHE_IDLE_TIMEOUT) and (
+                    model_impl.is_connected()
+                ):
+                    return model_impl
+                LOG.debug("Recycling cached connection to model %r", model)
+                await self._evict_model(model)
+            model_impl = await self.get_model(model)
+            self._model_cache[model] = (model_impl, time.monotonic())
+            return model_impl
+
+    async def _evict_model(self, model: str, model_impl: Model | None = None):
+        """Remove model from the connection cache and disconnect it.
+
+        Connections still in use are disconnected by their last user.
+
+        :model: Name of the model
+        :model_impl: Only evict the cached connection if it is this one
+        """
+        cached = self._model_cache.get(model)
+        if cached is None or (model_impl is not None and cached[0] is not model_impl):
+            return
+        del self._model_cache[model]
+        model_impl, _ = cached
+        if self._model_refs[model_impl] == 0:
+            await self._disconnect_model(model, model_impl)
+
+    async def _disconnect_model(self, model: str, model_impl: Model):
+        """Disconnect a model connection evicted from the cache.
+
+        :model: Name of the model
+        :model_impl: Model connection
+        """
+        if model_impl in self.model_connectors:
+            self.model_connectors.remove(model_impl)
+        try:
+            await model_impl.disconnect()
+        except Exception as e:
+            LOG.debug("Failed to disconnect model %r: %s", model, str(e))
+
     @contextlib.asynccontextmanager
     async def get_model_closing(self, model: str) -> AsyncGenerator[Model, None]:
         """Fetch model.
 
-        Allow closing a model after usage.
+        The model connection is cached and shared between concurrent users,
+        it is parked back after the last usage and closed on disconnect.
+        Connection errors invalidate the cached entry, API errors do not.
 
         Do not use the async context manager from the juju.model.Model
         object. It will try to read current model from the filesystem.
 
         :model: Name of the model
         """
-        model_impl = await self.get_model(model)
+        model_impl = await self._get_cached_model(model)
+        self._model_refs[model_impl] += 1
         try:
             yield model_impl
+        except (JujuConnectionError, websockets.ConnectionClosed):
+            await self._evict_model(model, model_impl)
+            raise
         finally:
-            await model_impl.disconnect()
+            self._model_refs[model_impl] -= 1
+            if self._model_refs[model_impl] == 0:
+                del self._model_refs[model_impl]
+                cached = self._model_cache.get(model)
+                if cached is not None and cached[0] is model_impl:
+                    self._model_cache[model] = (model_impl, time.monotonic())
+                else:
+                    await self._disconnect_model(model, model_impl)
 
     async def model_exists(self, model: str) -> bool:
         """Check if model exists.
@@ -330,17 +1002,35 @@ class JujuHelper:
         :credential: Name of the credential
         :config: model configuration
         """
-        # TODO(gboutry): workaround until we manage public ssh keys properly
-        old_home = os.environ["HOME"]
-        os.environ["HOME"] = os.environ["SNAP_REAL_HOME"]
-        try:
+        config = dict(config or {})
+        if "authorized-keys" not in config:
+            try:
+                config["authorized-keys"] = self._read_authorized_keys()
+            except OSError:
+                LOG.debug("Failed to read juju public ssh key", exc_info=True)
+
+        if "authorized-keys" in config:
             model_impl = await self.controller.add_model(
                 model, cloud_name=cloud, credential_name=credential, config=config
             )
-            self.model_connectors.append(model_impl)
-            return model_impl
-        finally:
-            os.environ["HOME"] = old_home
+        else:
+            # Let libjuju look the key up, and report its error
+            with _snap_home():
+                model_impl = await self.controller.add_model(
+                    model, cloud_name=cloud, credential_name=credential, config=config
+                )
+        self.model_connectors.append(model_impl)
+        return model_impl
+
+    def _read_authorized_keys(self) -> str:
+        """Read the juju public ssh key once, from the real home of the user."""
+        # TODO(gboutry): workaround until we manage public ssh keys properly
+        if self._authorized_keys is None:
+            with _snap_home():
+                public_key_path, _ = juju_utils.juju_ssh_key_paths()
+            with open(public_key_path) as ssh_key_file:
+                self._authorized_keys = ssh_key_file.readline().strip()
+        return self._authorized_keys
 
     async def destroy_model(
         self, model: str, destroy_storage: bool = False, force: bool = False
@@ -370,21 +1060,19 @@ class JujuHelper:
         :relation: Name of the relation
         """
         async with self.get_model_closing(model) as model_impl:
-            if requirer not in model_impl.applications:
-                raise ApplicationNotFoundException(
-                    f"Application {requirer!r} is missing from model {model!r}"
-                )
-            if provider not in model_impl.applications:
-                raise ApplicationNotFoundException(
-                    f"Application {provider!r} is missing from model {model!r}"
-                )
+            self._require_apps(model_impl, requirer, provider)
             endpoint_fmt = "{app}:{relation}"
             provider_relation = endpoint_fmt.format(app=provider, relation=relation)
             requirer_relation = endpoint_fmt.format(app=requirer, relation=relation)
             await model_impl.integrate(provider_relation, requirer_relation)
 
     async def are_integrated(
-        self, model: str, provider: str, requirer: str, relation: str
+        self,
+        model: str,
+        provider: str,
+        requirer: str,
+        relation: str,
+        snapshot: ModelSnapshot | None = None,
     ) -> bool:
         """Check if two applications are integrated.
 
@@ -394,9 +1082,16 @@ class JujuHelper:
         :provider: Name of the application providing the relation
         :requirer: Name of the application requiring the relation
         :relation: Name of the relation
+        :snapshot: Pre-fetched model snapshot, optional
         """
+        if snapshot is not None:
+            if provider not in snapshot.applications:
+                raise ApplicationNotFoundException(
+                    f"Application missing from model: {model!r}"
+                )
+            return snapshot.are_integrated(provider, requirer, relation)
         async with self.get_model_closing(model) as model_impl:
-            app = await self.get_application(provider, model_impl)
+            (app,) = self._require_apps(model_impl, provider)
             apps = (provider, requirer)
             for rel in app.relations:
                 if len(rel.endpoints) != 2:
@@ -412,6 +1107,37 @@ class JujuHelper:
                     return True
             return False
 
+    async def integrate_endpoints(self, model: str, provider: str, requirer: str):
+        """Integrate two endpoints of the model.
+
+        :model: Name of the model
+        :provider: Provider endpoint, format is application[:relation]
+        :requirer: Requirer endpoint, format is application[:relation]
+        """
+        async with self.get_model_closing(model) as model_impl:
+            await model_impl.integrate(provider, requirer)
+
+    async def remove_relation(
+        self, model: str, provider: str, requirer: str, force: bool = False
+    ):
+        """Remove the relation between two endpoints.
+
+        The relation is removed asynchronously by the controller, the call does
+        not wait for the relation to be gone.
+
+        :model: Name of the model
+        :provider: Provider endpoint, format is application[:relation]
+        :requirer: Requirer endpoint, format is application[:relation]
+        :force: Remove the relation even if its units are in error
+        """
+        async with self.get_model_closing(model) as model_impl:
+            application_facade = _facade(
+                juju_client.ApplicationFacade, model_impl.connection()
+            )
+            await application_facade.DestroyRelation(
+                endpoints=[provider, requirer], force=force or None
+            )
+
     async def get_model_name_with_owner(self, model: str) -> str:
         """Get juju model full name along with owner."""
         try:
@@ -429,17 +1155,68 @@ class JujuHelper:
         """Get juju filtered status."""
         async with self.get_model_closing(model) as model_impl:
             status = await model_impl.get_status(filter)
-            return json.loads(status.to_json())
+            return _to_primitive(status)
 
     async def get_model_status_full(self, model: str) -> dict:
         """Get juju status for the model."""
         return await self.get_model_status(model)
 
-    async def get_application_names(self, model: str) -> list[str]:
+    async def get_model_snapshot(
+        self, model: str, max_age: float | None = None
+    ) -> ModelSnapshot:
+        """Get a snapshot of the model status with a single status call.
+
+        :model: Name of the model
+        :max_age: Reuse the last snapshot of the model if it was fetched less
+            than max_age seconds ago, by default always fetch a new one
+        """
+        snapshot = self._snapshots.get(model)
+        if (
+            max_age is not None
+            and snapshot is not None
+            and time.monotonic() - snapshot.fetched_at < max_age
+        ):
+            return snapshot
+        status = await self.get_model_status(model)
+        snapshot = ModelSnapshot(name=model, status=status)
+        self._snapshots[model] = snapshot
+        return snapshot
+
+    async def prefetch(self, models: Iterable[str], snapshots: bool = False):
+        """Warm model connections in parallel, and optionally their snapshots.
+
+        Errors are logged and ignored, some models might not exist yet.
+
+        :models: Names of the models
+        :snapshots: Whether to also fetch model snapshots
+        """
+        names = list(dict.fromkeys(models))
+        results = await asyncio.gather(
+            *(self._get_cached_model(model) for model in names),
+            return_exceptions=True,
+        )
+        connected = []
+        for model, result in zip(names, results):
+            if isinstance(result, Exception):
+                LOG.debug("Failed to prefetch model %r: %s", model, str(result))
+            else:
+                connected.append(model)
+        if snapshots:
+            await asyncio.gather(
+                *(self.get_model_snapshot(model) for model in connected),
+                return_exceptions=True,
+            )
+
+    async def get_application_names(
+        self, model: str, snapshot: ModelSnapshot | None = None
+    ) -> list[str]:
         """Get Application names in the model.
 
         :model: Name of the model
+        :snapshot: Pre-fetched model snapshot, optional
         """
+        if snapshot is not None:
+            return snapshot.application_names()
         async with self.get_model_closing(model) as model_impl:
             return list(model_impl.applications.keys())
 
@@ -449,12 +1226,45 @@ class JujuHelper:
         :name: Application name
         :model: Name of the model where the application is located
         """
-        application = model.applications.get(name)
-        if application is None:
-            raise ApplicationNotFoundException(
-                f"Application missing from model: {model.name!r}"
-            )
-        return application
+        applications = await self.get_applications([name], model)
+        return applications[name]
+
+    async def get_applications(
+        self, names: list[str], model: Model
+    ) -> dict[str, Application]:
+        """Fetch several applications in model.
+
+        :names: Application names
+        :model: Name of the model where the applications are located
+        :returns: Mapping of application name to Application object
+        """
+        applications = {}
+        for name in names:
+            application = model.applications.get(name)
+            if application is None:
+                raise ApplicationNotFoundException(
+                    f"Application missing from model: {model.name!r}"
+                )
+            applications[name] = application
+        return applications
+
+    def _require_apps(self, model: Model, *names: str) -> tuple[Application, ...]:
+        """Fetch applications in model, raising on the first missing one.
+
+        :model: Model object
+        :names: Application names
+        :returns: Application objects, in the order of names
+        """
+        applications = model.applications
+        found = []
+        for name in names:
+            application = applications.get(name)
+            if application is None:
+                raise ApplicationNotFoundException(
+                    f"Application {name!r} is missing from model {model.name!r}"
+                )
+            found.append(application)
+        return tuple(found)
 
     async def get_machines(self, model: Model) -> dict[str, Machine]:
         """Fetch machines in model.
@@ -509,24 +1319,57 @@ class JujuHelper:
 
         Workaround for https://github.com/juju/python-libjuju/issues/1229
         """
+        (machine,) = await self.add_machines([name], model, base)
+        if isinstance(machine, JujuError):
+            raise machine
+        return machine
+
+    async def add_machines(
+        self, names: list[str], model: Model, base: str = JUJU_BASE
+    ) -> list[Machine | JujuError]:
+        """Add several machines to model in a single call.
+
+        Machines are added independently, the failure to add one machine does
+        not prevent the others from being added.
+
+        :names: Placement directives of the machines
+        :model: Model object
+        :base: Base of the machines
+        :returns: Machines or the error adding them, in the order of names
+        """
+        if not names:
+            return []
         base_name, base_channel = base.split("@")
-        params = juju_client.AddMachineParams(
-            placement=juju_client.Placement(scope=model.uuid, directive=name),
-            jobs=["JobHostUnits"],
-            base=juju_client.Base(channel=base_channel, name=base_name),
-        )
+        params = [
+            juju_client.AddMachineParams(
+                placement=juju_client.Placement(scope=model.uuid, directive=name),
+                jobs=["JobHostUnits"],
+                base=juju_client.Base(channel=base_channel, name=base_name),
+            )
+            for name in names
+        ]
 
-        client_facade = juju_client.MachineManagerFacade.from_connection(
-            model.connection()
+        client_facade = _facade(juju_client.MachineManagerFacade, model.connection())
+        results = await client_facade.AddMachines(params=params)
+        machine_ids = [
+            result.machine for result in results.machines if not result.error
+        ]
+        if machine_ids:
+            LOG.debug("Added new machines %s", ", ".join(machine_ids))
+        machines = iter(
+            await asyncio.gather(
+                *(
+                    model._wait_for_new("machine", machine_id)  # type: ignore
+                    for machine_id in machine_ids
+                )
+            )
         )
-        results = await client_facade.AddMachines(params=[params])
-        error = results.machines[0].error
-        if error:
-            raise JujuError("Error adding machine: %s" % error.message)
-        machine_id = results.machines[0].machine
-
-        LOG.debug("Added new machine %s", machine_id)
-        return await model._wait_for_new("machine", machine_id)  # type: ignore
+        return [
+            JujuError("Error adding machine %s: %s" % (name, result.error.message))
+            if result.error
+            else next(machines)
+            for name, result in zip(names, results.machines)
+        ]
 
     async def get_unit(self, name: str, model: Model) -> Unit:
         """Fetch an application's unit in model.
@@ -553,10 +1396,9 @@ class JujuHelper:
         :model: Model object
         """
         app = await self.get_application(application, model)
-        unit: Unit | None = None
-        for u in app.units:
-            if machine_id == u.machine.entity_id:
-                unit = u
+        unit: Unit | None = next(
+            (u for u in app.units if machine_id == u.machine.entity_id), None
+        )
         if unit is None:
             raise UnitNotFoundException(
                 f"Unit for application {application!r} on machine {machine_id!r} "
@@ -564,14 +1406,19 @@ class JujuHelper:
             )
         return unit
 
-    def _validate_unit(self, unit: str):
-        """Validate unit name."""
-        parts = unit.split("/")
-        if len(parts) != 2:
+    def _validate_unit(self, unit: str) -> tuple[str, str]:
+        """Validate unit name.
+
+        :unit: Unit name, format is application/id
+        :returns: Application name and unit id
+        """
+        match = _UNIT_NAME_RE.fullmatch(unit)
+        if match is None:
             raise ValueError(
                 f"Name {unit!r} has invalid format, "
                 "should be a valid unit of format application/id"
             )
+        return match["app"], match["id"]
 
     async def add_unit(
         self,
@@ -600,29 +1447,45 @@ class JujuHelper:
         :unit: Unit tag
         :model: Name of the model where the application is located
         """
-        self._validate_unit(unit)
-        async with self.get_model_closing(model) as model_impl:
-            application = model_impl.applications.get(name)
+        await self.remove_units(name, [unit], model)
 
-            if application is None:
-                raise ApplicationNotFoundException(
-                    f"Application {name!r} is missing from model {model!r}"
-                )
+    async def remove_units(self, name: str, units: list[str], model: str):
+        """Remove several units from application in a single call.
 
-            await application.destroy_unit(unit)
+        :name: Application name
+        :units: Unit tags
+        :model: Name of the model where the application is located
+        """
+        for unit in units:
+            self._validate_unit(unit)
+        async with self.get_model_closing(model) as model_impl:
+            (application,) = self._require_apps(model_impl, name)
+            await application.destroy_unit(*units)
 
     async def _get_leader_unit(self, name: str, model: Model) -> Unit:
         """Get leader unit.
 
+        Concurrent lookups for the same application are shared.
+
         :name: Application name
         :model: Model object
         :returns: Leader Unit object
         :raises: LeaderNotFoundException if no leader is found
         """
+        return await self._dedupe(
+            ("leader", model.name, name), lambda: self._find_leader_unit(name, model)
+        )
+
+    async def _find_leader_unit(self, name: str, model: Model) -> Unit:
+        """Find leader unit by querying application units."""
         application = await self.get_application(name, model)
 
-        for unit in application.units:
-            is_leader = await unit.is_leader_from_status()
+        # Query all units in parallel, leadership status is one RPC per unit
+        units = list(application.units)
+        results = await asyncio.gather(
+            *(unit.is_leader_from_status() for unit in units)
+        )
+        for unit, is_leader in zip(units, results):
             if is_leader:
                 return unit
 
@@ -630,24 +1493,52 @@ class JujuHelper:
             f"Leader for application {name!r} is missing from model {model.name!r}"
         )
 
-    async def get_leader_unit(self, name: str, model: str) -> str:
+    async def get_leader_unit(
+        self, name: str, model: str, snapshot: ModelSnapshot | None = None
+    ) -> str:
         """Get leader unit.
 
         :name: Application name
         :model: Name of the model where the application is located
+        :snapshot: Pre-fetched model snapshot, optional
         :returns: Unit name
         """
+        leaders = await self.get_leader_units([name], model, snapshot)
+        return leaders[name]
+
+    async def get_leader_units(
+        self, names: list[str], model: str, snapshot: ModelSnapshot | None = None
+    ) -> dict[str, str]:
+        """Get leader units of several applications.
+
+        Leaders are looked up within a single model context.
+
+        :names: Application names
+        :model: Name of the model where the applications are located
+        :snapshot: Pre-fetched model snapshot, optional
+        :returns: Mapping of application name to leader unit name
+        :raises: LeaderNotFoundException if no leader is found for an application
+        """
+        if snapshot is not None:
+            return {name: snapshot.leader_unit(name) for name in names}
         async with self.get_model_closing(model) as model_impl:
-            unit = await self._get_leader_unit(name, model_impl)
-            return unit.entity_id
+            units = await asyncio.gather(
+                *(self._get_leader_unit(name, model_impl) for name in names)
+            )
+            return {name: unit.entity_id for name, unit in zip(names, units)}
 
-    async def get_leader_unit_machine(self, name: str, model: str) -> str:
+    async def get_leader_unit_machine(
+        self, name: str, model: str, snapshot: ModelSnapshot | None = None
+    ) -> str:
         """Get leader unit machine id.
 
         :name: Application name
         :model: Name of the model where the application is located
+        :snapshot: Pre-fetched model snapshot, optional
         :returns: Machine entity id
         """
+        if snapshot is not None:
+            return snapshot.leader_unit_machine(name)
         async with self.get_model_closing(model) as model_impl:
             unit = await self._get_leader_unit(name, model_impl)
             return unit.machine.entity_id
@@ -698,7 +1589,11 @@ class JujuHelper:
             return action.results
 
     async def run_action(
-        self, name: str, model: str, action_name: str, action_params={}
+        self,
+        name: str,
+        model: str,
+        action_name: str,
+        action_params: dict | None = None,
     ) -> Dict:
         """Run action and return the response.
 
@@ -712,7 +1607,7 @@ class JujuHelper:
         """
         async with self.get_model_closing(model) as model_impl:
             unit = await self.get_unit(name, model_impl)
-            action_obj = await unit.run_action(action_name, **action_params)
+            action_obj = await unit.run_action(action_name, **(action_params or {}))
             await action_obj.wait()
             if action_obj._status != "completed":
                 output = await model_impl.get_action_output(action_obj.id)
@@ -720,6 +1615,55 @@ class JujuHelper:
 
             return action_obj.results
 
+    @staticmethod
+    def _index_secrets(secrets: Iterable) -> dict[str, dict]:
+        """Index listed secrets by uri and by name.
+
+        :secrets: Secrets returned by list_secrets
+        :returns: dict with "uri" and "name" indexes, names map to the list
+            of secrets carrying that name
+        """
+        index: dict[str, dict] = {"uri": {}, "name": {}}
+        for secret in secrets:
+            serialized = secret.serialize()
+            if secret.uri:
+                uri = secret.uri.removeprefix(SECRET_URI_PREFIX)
+                index["uri"][uri] = serialized
+            if secret.label:
+                index["name"].setdefault(secret.label, []).append(serialized)
+        return index
+
+    async def _lookup_secret(
+        self,
+        model_impl: Model,
+        kind: str,
+        key: str,
+        index: dict[str, dict] | None = None,
+    ) -> dict:
+        """Lookup secret by uri or by name.
+
+        Secrets are looked up in index first when given, otherwise or on index
+        miss, the secret is queried with a filtered listing.
+
+        :model_impl: Model object
+        :kind: Key kind, either "uri" or "name"
+        :key: Secret uri or name
+        :index: Secrets index built by the caller for the current call
+        """
+        lookup_key = key.removeprefix(SECRET_URI_PREFIX) if kind == "uri" else key
+        found = index[kind].get(lookup_key) if index is not None else None
+        if found is None:
+            secrets = await model_impl.list_secrets(
+                filter={kind: key}, show_secrets=True
+            )
+            found = self._index_secrets(secrets)[kind].get(lookup_key)
+        if kind == "name" and found is not None:
+            # Duplicated names are ambiguous
+            found = found[0] if len(found) == 1 else None
+        if found is None:
+            raise JujuSecretNotFound(f"Secret {key!r}")
+        return found
+
     async def add_secret(self, model: str, name: str, data: dict, info: str) -> str:
         """Add secret to the model.
 
@@ -749,12 +1693,28 @@ class JujuHelper:
         :secret_id: Secret ID
         """
         async with self.get_model_closing(model) as model_impl:
-            secrets = await model_impl.list_secrets(
-                filter={"uri": secret_id}, show_secrets=True
+            return await self._lookup_secret(model_impl, "uri", secret_id)
+
+    async def get_secrets(self, model: str, secret_ids: Iterable[str]) -> dict:
+        """Get several secrets from model with a single secrets listing.
+
+        The listing is only used for this call, secrets are never served
+        from an earlier listing.
+
+        :model: Name of the model
+        :secret_ids: Secret IDs
+        :returns: dict of secrets keyed by the requested IDs
+        """
+        async with self.get_model_closing(model) as model_impl:
+            index = self._index_secrets(
+                await model_impl.list_secrets(show_secrets=True)
             )
-            if len(secrets) != 1:
-                raise JujuSecretNotFound(f"Secret {secret_id!r}")
-            return secrets[0].serialize()
+            return {
+                secret_id: await self._lookup_secret(
+                    model_impl, "uri", secret_id, index
+                )
+                for secret_id in secret_ids
+            }
 
     async def get_secret_by_name(self, model: str, secret_name: str) -> dict:
         """Get secret from model.
@@ -763,12 +1723,7 @@ class JujuHelper:
         :secret_id: Secret Name
         """
         async with self.get_model_closing(model) as model_impl:
-            secrets = await model_impl.list_secrets(
-                filter={"name": secret_name}, show_secrets=True
-            )
-            if len(secrets) != 1:
-                raise JujuSecretNotFound(f"Secret {secret_name!r}")
-            return secrets[0].serialize()
+            return await self._lookup_secret(model_impl, "name", secret_name)
 
     async def remove_secret(self, model: str, name: str):
         """Remove secret in the model.
@@ -799,10 +1754,8 @@ class JujuHelper:
                 auth_type="oauth2", attrs={"Token": user["token"]}
             )
         elif "client-certificate-data" in user and "client-key-data" in user:
-            client_certificate_data = base64.b64decode(
-                user["client-certificate-data"]
-            ).decode("utf-8")
-            client_key_data = base64.b64decode(user["client-key-data"]).decode("utf-8")
+            client_certificate_data = _decode_b64(user["client-certificate-data"])
+            client_key_data = _decode_b64(user["client-key-data"])
             cred = juju_client.CloudCredential(
                 auth_type="clientcertificate",
                 attrs={
@@ -820,17 +1773,16 @@ class JujuHelper:
         return cred
 
     async def add_k8s_cloud(
-        self, cloud_name: str, credential_name: str, kubeconfig: dict
+        self,
+        cloud_name: str,
+        credential_name: str,
+        kubeconfig: dict | KubeconfigIndex,
     ):
         """Add k8s cloud to controller."""
-        contexts = {v["name"]: v["context"] for v in kubeconfig["contexts"]}
-        clusters = {v["name"]: v["cluster"] for v in kubeconfig["clusters"]}
-        users = {v["name"]: v["user"] for v in kubeconfig["users"]}
-
         # TODO(gboutry): parse context with lightkube for better handling
-        ctx = contexts.get(kubeconfig.get("current-context", {}), {})
-        cluster = clusters.get(ctx.get("cluster", {}), {})
-        user = users.get(ctx.get("user"), {})
+        index = KubeconfigIndex.from_kubeconfig(kubeconfig)
+        cluster = index.cluster
+        user = index.user
 
         if user is None:
             raise UnsupportedKubeconfigException(
@@ -838,9 +1790,8 @@ class JujuHelper:
             )
 
         ep = cluster["server"]
-        ca_cert = base64.b64decode(cluster["certificate-authority-data"]).decode(
-            "utf-8"
-        )
+        ca_cert = _decode_b64(cluster["certificate-authority-data"])
+        cred = self._generate_juju_credential(user)
 
         try:
             cloud = juju_client.Cloud(
@@ -856,26 +1807,19 @@ class JujuHelper:
             if "already exists" not in str(e):
                 raise e
 
-        cred = self._generate_juju_credential(user)
         await self.controller.add_credential(
             credential_name, credential=cred, cloud=cloud_name
         )
 
-    async def update_k8s_cloud(self, cloud_name: str, kubeconfig: dict):
+    async def update_k8s_cloud(
+        self, cloud_name: str, kubeconfig: dict | KubeconfigIndex
+    ):
         """Update K8S cloud endpoint."""
-        contexts = {v["name"]: v["context"] for v in kubeconfig["contexts"]}
-        clusters = {v["name"]: v["cluster"] for v in kubeconfig["clusters"]}
-
-        ctx = contexts.get(kubeconfig.get("current-context", {}), {})
-        cluster = clusters.get(ctx.get("cluster", {}), {})
+        cluster = KubeconfigIndex.from_kubeconfig(kubeconfig).cluster
 
         ep = cluster["server"]
-        ca_cert = base64.b64decode(cluster["certificate-authority-data"]).decode(
-            "utf-8"
-        )
-        cloud_facade = juju_client.CloudFacade.from_connection(
-            self.controller.connection()
-        )
+        ca_cert = _decode_b64(cluster["certificate-authority-data"])
+        cloud_facade = _facade(juju_client.CloudFacade, self.controller.connection())
         await cloud_facade.UpdateCloud(
             [
                 {
@@ -895,13 +1839,13 @@ class JujuHelper:
         )
 
     async def add_k8s_credential(
-        self, cloud_name: str, credential_name: str, kubeconfig: dict
+        self,
+        cloud_name: str,
+        credential_name: str,
+        kubeconfig: dict | KubeconfigIndex,
     ):
         """Add K8S Credential to controller."""
-        contexts = {v["name"]: v["context"] for v in kubeconfig["contexts"]}
-        users = {v["name"]: v["user"] for v in kubeconfig["users"]}
-        ctx = contexts.get(kubeconfig.get("current-context"), {})
-        user = users.get(ctx.get("user"), {})
+        user = KubeconfigIndex.from_kubeconfig(kubeconfig).user
 
         if user is None:
             raise UnsupportedKubeconfigException(
@@ -929,13 +1873,12 @@ class JujuHelper:
             ["active"]
         :timeout: Waiting timeout in seconds
         """
-        if accepted_status is None:
-            accepted_status = ["active"]
+        accepted = frozenset(
+            ("active",) if accepted_status is None else accepted_status
+        )
 
         async with self.get_model_closing(model) as model_impl:
-            application = typing.cast(
-                Application | None, model_impl.applications.get(name)
-            )
+            application: Application | None = model_impl.applications.get(name)
             if application is None:
                 return
 
@@ -944,12 +1887,14 @@ class JujuHelper:
             try:
                 LOG.debug(
                     "Waiting for app status to be: {} {}".format(
-                        application.status, accepted_status
+                        application.status, sorted(accepted)
                     )
                 )
-                await model_impl.block_until(
-                    lambda: application.status in accepted_status,
-                    timeout=timeout,
+                await _wait_for_condition(
+                    model_impl,
+                    lambda: application.status in accepted,
+                    ("application",),
+                    timeout,
                 )
             except asyncio.TimeoutError as e:
                 raise TimeoutException(
@@ -970,11 +1915,12 @@ class JujuHelper:
         """
         async with self.get_model_closing(model) as model_impl:
             name_set = set(names)
-            empty_set: set[str] = set()
             try:
-                await model_impl.block_until(
-                    lambda: name_set.intersection(model_impl.applications) == empty_set,
-                    timeout=timeout,
+                await _wait_for_condition(
+                    model_impl,
+                    lambda: name_set.isdisjoint(model_impl.applications),
+                    ("application",),
+                    timeout,
                 )
             except asyncio.TimeoutError as e:
                 raise TimeoutException(
@@ -992,13 +1938,33 @@ class JujuHelper:
         :model: Name of the model
         :timeout: Waiting timeout in seconds
         """
+        uuid = (await self.controller.model_uuids()).get(model)
+        if uuid is None:
+            return
+        model_manager = _facade(
+            juju_client.ModelManagerFacade, self.controller.connection()
+        )
 
-        async def condition():
-            models = await self.controller.list_models()
-            return model not in models
+        async def _wait():
+            # Only query the watched model, backing off while it is removed
+            interval = MODEL_GONE_POLL_INTERVAL
+            while True:
+                results = await model_manager.ModelInfo(
+                    entities=[juju_client.Entity(tag=f"model-{uuid}")]
+                )
+                error = results.results[0].error
+                if error is not None:
+                    if error.code == "not found":
+                        return
+                    # Confirm with the model list on unexpected errors
+                    LOG.debug("Model %r info error: %s", model, error.message)
+                    if model not in await self.controller.list_models():
+                        return
+                await asyncio.sleep(interval)
+                interval = min(interval * 2, MODEL_GONE_POLL_MAX_INTERVAL)
 
         try:
-            await juju_utils.block_until_with_coroutine(condition, timeout=timeout)
+            await asyncio.wait_for(_wait(), timeout)
         except asyncio.TimeoutError as e:
             raise TimeoutException(
                 f"Timed out while waiting for model {model} to be gone"
@@ -1018,11 +1984,12 @@ class JujuHelper:
         """
         async with self.get_model_closing(model) as model_impl:
             name_set = set(names)
-            empty_set: set[str] = set()
             try:
-                await model_impl.block_until(
-                    lambda: name_set.intersection(model_impl.units) == empty_set,
-                    timeout=timeout,
+                await _wait_for_condition(
+                    model_impl,
+                    lambda: name_set.isdisjoint(model_impl.units),
+                    ("unit",),
+                    timeout,
                 )
             except asyncio.TimeoutError as e:
                 raise TimeoutException(
@@ -1047,10 +2014,7 @@ class JujuHelper:
                 return True
 
             try:
-                await model_impl.block_until(
-                    condition,
-                    timeout=timeout,
-                )
+                await _wait_for_condition(model_impl, condition, ("machine",), timeout)
             except asyncio.TimeoutError as e:
                 raise TimeoutException(
                     "Timed out while waiting for machines to be deployed"
@@ -1094,18 +2058,19 @@ class JujuHelper:
         Workload status message is checked only if provided in input. Empty status
         message is considered as an expected workload status message.
         """
-        if expected_status is None:
-            expected_status = {"active"}
-        else:
-            expected_status = set(expected_status)
+        expected_status = frozenset(
+            ("active",) if expected_status is None else expected_status
+        )
+        if expected_agent_status is not None:
+            expected_agent_status = frozenset(expected_agent_status)
+        watch = _model_watch(model)
         try:
             while True:
-                status = await model.get_status([app])
+                changed = watch.changed("application", "unit")
+                status = await watch.get_status(model, app)
                 if app not in status.applications:
                     raise ValueError(f"Application {app} not found in status")
-                application = typing.cast(
-                    "juju_def.ApplicationStatus", status.applications[app]
-                )
+                application: juju_def.ApplicationStatus = status.applications[app]
 
                 units = application.units
                 app_status: set[str] = set()
@@ -1117,8 +2082,8 @@ class JujuHelper:
                     if application.status:
                         app_status = {str(application.status.status)}
                 else:
+                    unit: juju_def.UnitStatus
                     for name, unit in units.items():
-                        unit = typing.cast("juju_def.UnitStatus", unit)
                         if unit_list is None or name in unit_list:
                             if wl_status := unit.workload_status:
                                 app_status.add(str(wl_status.status))
@@ -1161,7 +2126,8 @@ class JujuHelper:
                     if queue is not None:
                         queue.put_nowait(app)
                     return
-                await asyncio.sleep(15)
+                # Check again as soon as the model changes
+                await watch.wait(changed, STATUS_POLL_INTERVAL)
         except asyncio.CancelledError:
             LOG.debug("Waiting for %r cancelled", app)
 
@@ -1194,11 +2160,15 @@ class JujuHelper:
         async with self.get_model_closing(model) as model_impl:
             LOG.debug("Waiting for apps %r to be %r", apps, wl_status)
 
+            units_by_app: dict[str, list[str]] | None = None
+            if units is not None:
+                units_by_app = collections.defaultdict(list)
+                for unit in units:
+                    units_by_app[unit.split("/", 1)[0]].append(unit)
+
             tasks = []
             for app in apps:
-                unit_list = (
-                    None if units is None else [unit for unit in units if app in unit]
-                )
+                unit_list = None if units_by_app is None else units_by_app.get(app)
                 if unit_list:
                     LOG.debug(
                         "Waiting for units %r of app %r to be %r",
@@ -1220,33 +2190,32 @@ class JujuHelper:
                         name=app,
                     )
                 )
-            excs = []
+            if not tasks:
+                return
             try:
-                await asyncio.wait_for(
-                    asyncio.gather(*tasks, return_exceptions=True), timeout=timeout
+                # A failing worker stops the wait right away, its siblings
+                # are cancelled below instead of running until the timeout
+                _, pending = await asyncio.wait(
+                    tasks, timeout=timeout, return_when=asyncio.FIRST_EXCEPTION
                 )
-            except asyncio.TimeoutError as e:
-                raise TimeoutException(
-                    f"Timed out while waiting for model {model!r} to be ready"
-                ) from e
             finally:
                 for task in tasks:
                     task.cancel()
-                    if (
-                        task.done()
-                        and not task.cancelled()
-                        and (ex := task.exception())
-                    ):
-                        LOG.debug(
-                            "coroutine %r exception: %s", task.get_name(), str(ex)
-                        )
-                        excs.append(ex)
+                await asyncio.gather(*tasks, return_exceptions=True)
 
+            excs = []
+            for task in tasks:
+                if not task.cancelled() and (ex := task.exception()):
+                    LOG.debug("coroutine %r exception: %s", task.get_name(), str(ex))
+                    excs.append(ex)
             if excs:
-                # python 3.11 use ExceptionGroup
                 raise JujuWaitException(
                     f"Error while waiting for model {model!r} to be ready", excs
                 )
+            if pending:
+                raise TimeoutException(
+                    f"Timed out while waiting for model {model!r} to be ready"
+                )
 
     async def set_application_config(self, model: str, app: str, config: dict):
         """Update application configuration.
@@ -1258,13 +2227,19 @@ class JujuHelper:
         async with self.get_model_closing(model) as model_impl:
             await model_impl.applications[app].set_config(config)
 
-    async def get_charm_channel(self, application_name: str, model: str) -> str:
+    async def get_charm_channel(
+        self, application_name: str, model: str, status: dict | None = None
+    ) -> str:
         """Get the charm-channel from a deployed application.
 
         :param application_list: Name of application
         :param model: Name of model
+        :param status: Dictionary of model status, a recent snapshot of the
+            model is used if not provided
         """
-        status = await self.get_model_status_full(model)
+        if status is None:
+            snapshot = await self.get_model_snapshot(model, max_age=SNAPSHOT_MAX_AGE)
+            status = snapshot.status
         return status["applications"].get(application_name, {}).get("charm-channel")
 
     async def charm_refresh(self, application_name: str, model: Model):
@@ -1341,7 +2316,13 @@ class JujuHelper:
         """Get spaces in model."""
         async with self.get_model_closing(model) as model_impl:
             spaces = await model_impl.get_spaces()
-            return [json.loads(space.to_json()) for space in spaces]
+            return [_to_primitive(space) for space in spaces]
+
+    async def list_space_names(self, model: str) -> set[str]:
+        """List names of the spaces in model."""
+        async with self.get_model_closing(model) as model_impl:
+            spaces = await model_impl.get_spaces()
+            return {space.name for space in spaces}
 
     async def add_space(self, model: str, space: str, subnets: list[str]):
         """Add a space to the model."""
@@ -1355,14 +2336,22 @@ class JujuHelper:
         """Get endpoint bindings for an application."""
         async with self.get_model_closing(model) as model_impl:
             app = await self.get_application(application, model_impl)
-            facade = app._facade()
-            try:
-                app_config = await facade.Get(application=app.name)
-            except JujuError as e:
-                raise JujuException(
-                    f"Failed to get bindings for application {app.name!r}: {str(e)}"
-                ) from e
-            return app_config.endpoint_bindings
+            return await self._get_bindings(app, app._facade())
+
+    @staticmethod
+    async def _get_bindings(app: Application, facade: typing.Any) -> dict:
+        """Get endpoint bindings of a resolved application.
+
+        :app: Application object
+        :facade: Application facade of the model connection
+        """
+        try:
+            app_config = await facade.Get(application=app.name)
+        except JujuError as e:
+            raise JujuException(
+                f"Failed to get bindings for application {app.name!r}: {str(e)}"
+            ) from e
+        return app_config.endpoint_bindings
 
     async def merge_bindings(
         self, model: str, application: str, bindings: dict[str, str]
@@ -1370,7 +2359,11 @@ class JujuHelper:
         """Update endpoint bindings for an application."""
         async with self.get_model_closing(model) as model_impl:
             app = await self.get_application(application, model_impl)
-            app_bindings = await self.get_application_bindings(model, application)
+            facade = app._facade()
+            app_bindings, space_names = await asyncio.gather(
+                self._get_bindings(app, facade),
+                self.list_space_names(model),
+            )
 
             # Check bindings provided are valid
             charm_endpoints = set(app_bindings.keys())
@@ -1381,10 +2374,7 @@ class JujuHelper:
                     f" {', '.join(unknown_endpoints)}"
                 )
             # Check spaces are valid
-            spaces = await self.get_spaces(model)
-            unknown_spaces = set(bindings.values()) - {
-                space["name"] for space in spaces
-            }
+            unknown_spaces = set(bindings.values()) - space_names
             if unknown_spaces:
                 raise JujuException(
                     f"Bindings contain unknown spaces: {', '.join(unknown_spaces)}"
@@ -1396,7 +2386,6 @@ class JujuHelper:
                     "bindings": bindings,
                 }
             ]
-            facade = app._facade()
             try:
                 await facade.MergeBindings(request)
             except JujuError as e:
@@ -1408,9 +2397,7 @@ class JujuStepHelper:
 
     def _get_juju_binary(self) -> str:
         """Get juju binary path."""
-        snap = Snap()
-        juju_binary = snap.paths.snap / "juju" / "bin" / "juju"
-        return str(juju_binary)
+        return _juju_binary()
 
     def _juju_cmd(self, *args):
         """Runs the specified juju command line command.
@@ -1489,8 +2476,11 @@ class JujuStepHelper:
         if clouds is None:
             return list(controllers.keys())
 
+        cloud_names = frozenset(clouds)
         existing_controllers = [
-            name for name, details in controllers.items() if details["cloud"] in clouds
+            name
+            for name, details in controllers.items()
+            if details["cloud"] in cloud_names
         ]
         LOG.debug(
             f"There are {len(existing_controllers)} existing {clouds} "
@@ -1500,17 +2490,22 @@ class JujuStepHelper:
 
     def get_external_controllers(self) -> list:
         """Get all external controllers registered."""
-        snap = Snap()
-        data_location = snap.paths.user_data
-        external_controllers = []
-
-        controllers = self.get_controllers()
-        for controller in controllers:
-            account_file = data_location / f"{controller}.yaml"
-            if account_file.exists():
-                external_controllers.append(controller)
+        data_location = _snap_user_data()
+        try:
+            with os.scandir(data_location) as entries:
+                account_files = {
+                    entry.name.removesuffix(".yaml")
+                    for entry in entries
+                    if entry.name.endswith(".yaml")
+                }
+        except FileNotFoundError:
+            return []
 
-        return external_controllers
+        return [
+            controller
+            for controller in self.get_controllers()
+            if controller in account_files
+        ]
 
     def get_controller(self, controller: str) -> dict:
         """Get controller definition."""
@@ -1546,49 +2541,51 @@ class JujuStepHelper:
         if cloud["clouds"][name]["type"] not in ("manual", "maas"):
             return False
 
-        with tempfile.NamedTemporaryFile() as temp:
-            temp.write(yaml.dump(cloud).encode("utf-8"))
-            temp.flush()
-            cmd = [
-                self._get_juju_binary(),
-                "add-cloud",
-                name,
-                "--file",
-                temp.name,
-                "--client",
-            ]
-            if controller:
-                cmd.extend(["--controller", controller, "--force"])
-            LOG.debug(f"Running command {' '.join(cmd)}")
-            process = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            LOG.debug(
-                f"Command finished. stdout={process.stdout}, stderr={process.stderr}"
-            )
+        cmd = [
+            self._get_juju_binary(),
+            "add-cloud",
+            name,
+            "--file",
+            "/dev/stdin",
+            "--client",
+        ]
+        if controller:
+            cmd.extend(["--controller", controller, "--force"])
+        LOG.debug(f"Running command {' '.join(cmd)}")
+        process = subprocess.run(
+            cmd,
+            input=yaml.dump(cloud, Dumper=_YAML_DUMPER),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        LOG.debug(f"Command finished. stdout={process.stdout}, stderr={process.stderr}")
 
         return True
 
     def add_k8s_cloud_in_client(self, name: str, kubeconfig: dict):
         """Add k8s cloud in juju client."""
-        with tempfile.NamedTemporaryFile() as temp:
-            temp.write(yaml.dump(kubeconfig).encode("utf-8"))
-            temp.flush()
-            cmd = [
-                self._get_juju_binary(),
-                "add-k8s",
-                name,
-                "--client",
-                "--region=localhost/localhost",
-            ]
+        cmd = [
+            self._get_juju_binary(),
+            "add-k8s",
+            name,
+            "--client",
+            "--region=localhost/localhost",
+        ]
 
-            env = os.environ.copy()
-            env.update({"KUBECONFIG": temp.name})
-            LOG.debug(f"Running command {' '.join(cmd)}")
-            process = subprocess.run(
-                cmd, capture_output=True, text=True, check=True, env=env
-            )
-            LOG.debug(
-                f"Command finished. stdout={process.stdout}, stderr={process.stderr}"
-            )
+        # add-k8s reads the kubeconfig from stdin when it is piped in
+        env = os.environ.copy()
+        env.pop("KUBECONFIG", None)
+        LOG.debug(f"Running command {' '.join(cmd)}")
+        process = subprocess.run(
+            cmd,
+            input=yaml.dump(kubeconfig, Dumper=_YAML_DUMPER),
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
+        LOG.debug(f"Command finished. stdout={process.stdout}, stderr={process.stderr}")
 
     def add_credential(self, cloud: str, credential: dict, controller: str | None):
         """Add credentials to client or controller.
@@ -1596,25 +2593,26 @@ class JujuStepHelper:
         If controller is specidifed, credential is added to controller.
         If controller is None, credential is added to client.
         """
-        with tempfile.NamedTemporaryFile() as temp:
-            temp.write(yaml.dump(credential).encode("utf-8"))
-            temp.flush()
-            cmd = [
-                self._get_juju_binary(),
-                "add-credential",
-                cloud,
-                "--file",
-                temp.name,
-            ]
-            if controller:
-                cmd.extend(["--controller", controller])
-            else:
-                cmd.extend(["--client"])
-            LOG.debug(f"Running command {' '.join(cmd)}")
-            process = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            LOG.debug(
-                f"Command finished. stdout={process.stdout}, stderr={process.stderr}"
-            )
+        cmd = [
+            self._get_juju_binary(),
+            "add-credential",
+            cloud,
+            "--file",
+            "/dev/stdin",
+        ]
+        if controller:
+            cmd.extend(["--controller", controller])
+        else:
+            cmd.extend(["--client"])
+        LOG.debug(f"Running command {' '.join(cmd)}")
+        process = subprocess.run(
+            cmd,
+            input=yaml.dump(credential, Dumper=_YAML_DUMPER),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        LOG.debug(f"Command finished. stdout={process.stdout}, stderr={process.stderr}")
 
     def integrate(
         self,
@@ -1622,8 +2620,23 @@ class JujuStepHelper:
         provider: str,
         requirer: str,
         ignore_error_if_exists: bool = True,
+        jhelper: JujuHelper | None = None,
     ):
-        """Juju integrate applications."""
+        """Juju integrate applications.
+
+        When jhelper is given, integrations within the model go through the
+        controller API. Offers from other controllers always require the juju
+        client.
+        """
+        if jhelper is not None and not _is_offer_url(provider, requirer):
+            try:
+                run_sync(jhelper.integrate_endpoints(model, provider, requirer))
+            except JujuAPIError as e:
+                LOG.debug(str(e))
+                if not (ignore_error_if_exists and "already exists" in str(e)):
+                    raise e
+            return
+
         cmd = [
             self._get_juju_binary(),
             "integrate",
@@ -1643,8 +2656,24 @@ class JujuStepHelper:
             if ignore_error_if_exists and "already exists" not in e.stderr:
                 raise e
 
-    def remove_relation(self, model: str, provider: str, requirer: str):
-        """Juju remove relation."""
+    def remove_relation(
+        self,
+        model: str,
+        provider: str,
+        requirer: str,
+        force: bool = False,
+        jhelper: JujuHelper | None = None,
+    ):
+        """Juju remove relation.
+
+        When jhelper is given, relations within the model are removed through
+        the controller API. Offers from other controllers always require the
+        juju client.
+        """
+        if jhelper is not None and not _is_offer_url(provider, requirer):
+            run_sync(jhelper.remove_relation(model, provider, requirer, force=force))
+            return
+
         cmd = [
             self._get_juju_binary(),
             "remove-relation",
@@ -1653,6 +2682,8 @@ class JujuStepHelper:
             provider,
             requirer,
         ]
+        if force:
+            cmd.append("--force")
         LOG.debug(f"Running command {' '.join(cmd)}")
         process = subprocess.run(cmd, capture_output=True, text=True, check=True)
         LOG.debug(f"Command finished. stdout={process.stdout}, stderr={process.stderr}")
@@ -1672,12 +2703,12 @@ class JujuStepHelper:
         if not app_status:
             LOG.debug(f"{application_name} not present in model")
             return False
-        deployed_revision = int(self._extract_charm_revision(app_status["charm"]))
-        charm_name = self._extract_charm_name(app_status["charm"])
         deployed_channel = self.normalise_channel(app_status["charm-channel"])
-        if len(deployed_channel.split("/")) > 2:
+        if deployed_channel.count("/") >= 2:
             LOG.debug(f"Cannot calculate upgrade for {application_name}, branch in use")
             return False
+        charm_name, revision = self._parse_charm_url(app_status["charm"])
+        deployed_revision = int(revision)
         available_revision = run_sync(
             self.jhelper.get_available_charm_revision(
                 model, charm_name, deployed_channel
@@ -1685,35 +2716,50 @@ class JujuStepHelper:
         )
         return bool(available_revision > deployed_revision)
 
-    def get_charm_deployed_versions(self, model: str) -> dict:
+    def get_charm_deployed_versions(
+        self, model: str, status: dict | None = None
+    ) -> dict:
         """Return charm deployed info for all the applications in model.
 
         For each application, return a tuple of charm name, channel and revision.
         Example output:
         {"keystone": ("keystone-k8s", "2023.2/stable", 234)}
+
+        :param model: Name of model
+        :param status: Dictionary of model status, fetched if not provided
         """
-        status = run_sync(self.jhelper.get_model_status_full(model))
+        if not status:
+            status = run_sync(self.jhelper.get_model_status_full(model))
 
         apps = {}
         for app_name, app_status in status.get("applications", {}).items():
-            charm_name = self._extract_charm_name(app_status["charm"])
+            charm_name, revision = self._parse_charm_url(app_status["charm"])
             deployed_channel = self.normalise_channel(app_status["charm-channel"])
-            deployed_revision = int(self._extract_charm_revision(app_status["charm"]))
+            deployed_revision = int(revision)
             apps[app_name] = (charm_name, deployed_channel, deployed_revision)
 
         return apps
 
-    def get_apps_filter_by_charms(self, model: str, charms: list) -> list:
+    def get_apps_filter_by_charms(
+        self, model: str, charms: list, status: dict | None = None
+    ) -> list:
         """Return apps filtered by given charms.
 
         Get all apps from the model and return only the apps deployed with
         charms in the provided list.
+
+        :param model: Name of model
+        :param charms: Names of charms to filter on
+        :param status: Dictionary of model status, fetched if not provided
         """
-        deployed_all_apps = self.get_charm_deployed_versions(model)
+        if not status:
+            status = run_sync(self.jhelper.get_model_status_full(model))
+
+        charms_set = frozenset(charms)
         return [
             app_name
-            for app_name, (charm, channel, revision) in deployed_all_apps.items()
-            if charm in charms
+            for app_name, app_status in status.get("applications", {}).items()
+            if self._extract_charm_name(app_status["charm"]) in charms_set
         ]
 
     def normalise_channel(self, channel: str) -> str:
@@ -1723,24 +2769,31 @@ class JujuStepHelper:
 
         :param channel: Channel string to normalise
         """
-        if channel in ["stable", "candidate", "beta", "edge"]:
-            channel = f"latest/{channel}"
-        return channel
+        return _normalise_channel(channel)
+
+    def _parse_charm_url(self, charm_url: str) -> tuple[str, str]:
+        """Extract charm name and revision from charm url.
+
+        ch:amd64/jammy/cinder-k8s-50 -> (cinder-k8s, 50)
+
+        :param charm_url: Url to examine
+        """
+        name, _, revision = charm_url.rpartition("/")[2].rpartition("-")
+        return name, revision
 
     def _extract_charm_name(self, charm_url: str) -> str:
         """Extract charm name from charm url.
 
         :param charm_url: Url to examine
         """
-        # XXX There must be a better way. ch:amd64/jammy/cinder-k8s-50 -> cinder-k8s
-        return charm_url.split("/")[-1].rsplit("-", maxsplit=1)[0]
+        return self._parse_charm_url(charm_url)[0]
 
     def _extract_charm_revision(self, charm_url: str) -> str:
         """Extract charm revision from charm url.
 
         :param charm_url: Url to examine
         """
-        return charm_url.split("-")[-1]
+        return charm_url.rpartition("-")[2]
 
     def channel_update_needed(self, channel: str, new_channel: str) -> bool:
         """Compare two channels and see if the second is 'newer'.
@@ -1748,20 +2801,24 @@ class JujuStepHelper:
         :param current_channel: Current channel
         :param new_channel: Proposed new channel
         """
-        risks = ["stable", "candidate", "beta", "edge"]
         current_channel = self.normalise_channel(channel)
-        current_track, current_risk = current_channel.split("/")
-        new_track, new_risk = new_channel.split("/")
+        current_track, _, current_risk = current_channel.partition("/")
+        new_track, _, new_risk = new_channel.partition("/")
         if current_track != new_track:
             try:
-                return version.parse(current_track) < version.parse(new_track)
+                return _parse_track_version(current_track) < _parse_track_version(
+                    new_track
+                )
             except version.InvalidVersion:
                 LOG.error("Error: Could not compare tracks")
                 return False
-        if risks.index(current_risk) < risks.index(new_risk):
-            return True
-        else:
+        # Branches, as in track/risk/branch, do not change the risk order
+        current_order = CHANNEL_RISK_ORDER.get(current_risk.partition("/")[0])
+        new_order = CHANNEL_RISK_ORDER.get(new_risk.partition("/")[0])
+        if current_order is None or new_order is None:
+            LOG.error("Error: Could not compare risks")
             return False
+        return current_order < new_order
 
     def get_model_name_with_owner(self, model: str) -> str:
         """Return model name with owner name.
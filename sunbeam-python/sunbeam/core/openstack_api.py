@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import logging
+from typing import Iterable
 
 import openstack
 
@@ -43,16 +44,26 @@ def get_admin_connection(jhelper: JujuHelper) -> openstack.connection.Connection
 
 
 def guests_on_hypervisor(
-    hypervisor_name: str, jhelper: JujuHelper
+    hypervisor_name: str,
+    jhelper: JujuHelper,
+    statuses: Iterable[str] | None = None,
 ) -> list[openstack.compute.v2.server.Server]:
     """Return a list of guests that run on the given hypervisor.
 
+    Guests are listed with a single request, the status filter is applied
+    locally so that several statuses do not need one request each.
+
     :param hypervisor_name: Name of hypervisor
     :param jhelper: Juju helpers for retrieving admin credentials
+    :param statuses: Only return guests in one of these statuses, optional
     :raises: openstack.exceptions.SDKException
     """
     conn = get_admin_connection(jhelper)
-    return list(conn.compute.servers(all_projects=True, host=hypervisor_name))
+    guests = conn.compute.servers(all_projects=True, host=hypervisor_name)
+    if statuses is None:
+        return list(guests)
+    wanted = frozenset(statuses)
+    return [guest for guest in guests if guest.status in wanted]
 
 
 def remove_compute_service(
@@ -35,6 +35,7 @@ from sunbeam.core.common import (
     BaseStep,
     Result,
     ResultType,
+    cancel_status_background,
     read_config,
     update_config,
     update_status_background,
@@ -308,8 +309,7 @@ class AddMachineUnitsStep(BaseStep):
             LOG.warning(str(e))
             return Result(ResultType.FAILED, str(e))
         finally:
-            if not task.done():
-                task.cancel()
+            cancel_status_background(task)
         return Result(ResultType.COMPLETED)
 
 
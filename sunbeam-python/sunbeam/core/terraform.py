@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import json
 import logging
 import os
@@ -21,6 +22,7 @@ from datetime import datetime
 from pathlib import Path
 from string import Template
 
+import orjson
 from rich.status import Status
 from snaphelpers import Snap
 
@@ -90,6 +92,8 @@ class TerraformHelper:
         self.backend = backend or "local"
         self.terraform = str(self.snap.paths.snap / "bin" / "terraform")
         self.clusterd_address = clusterd_address
+        # Cached outputs, dropped whenever this helper modifies the state
+        self._output: dict | None = None
 
     def backend_config(self) -> dict:
         """Get backend configuration for terraform."""
@@ -130,8 +134,7 @@ class TerraformHelper:
     def write_tfvars(self, vars: dict, location: Path | None = None) -> None:
         """Write terraform variables file."""
         filepath = location or (self.path / "terraform.tfvars.json")
-        with filepath.open("w") as tfvars:
-            tfvars.write(json.dumps(vars))
+        filepath.write_bytes(orjson.dumps(vars, option=orjson.OPT_NON_STR_KEYS))
 
     def write_terraformrc(self) -> None:
         """Write .terraformrc file."""
@@ -149,6 +152,7 @@ class TerraformHelper:
             self.env.update(env)
         else:
             self.env = env
+        self._output = None
 
     def init(self) -> None:
         """Terraform init."""
@@ -162,6 +166,8 @@ class TerraformHelper:
         backend_updated = False
         if self.backend:
             backend_updated = self.write_backend_tf()
+        if backend_updated:
+            self._output = None
         self.write_terraformrc()
 
         try:
@@ -188,6 +194,7 @@ class TerraformHelper:
 
     def apply(self, extra_args: list | None = None):
         """Terraform apply."""
+        self._output = None
         os_env = os.environ.copy()
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
         tf_log = str(self.path / f"terraform-apply-{timestamp}.log")
@@ -223,6 +230,7 @@ class TerraformHelper:
 
     def destroy(self):
         """Terraform destroy."""
+        self._output = None
         os_env = os.environ.copy()
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
         tf_log = str(self.path / f"terraform-destroy-{timestamp}.log")
@@ -259,7 +267,15 @@ class TerraformHelper:
             raise TerraformException(str(e))
 
     def output(self, hide_output: bool = False) -> dict:
-        """Terraform output."""
+        """Terraform output.
+
+        Outputs are cached until the state is modified through this helper.
+        """
+        if self._output is None:
+            self._output = self._fetch_output(hide_output)
+        return copy.deepcopy(self._output)
+
+    def _fetch_output(self, hide_output: bool) -> dict:
         os_env = os.environ.copy()
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
         tf_log = str(self.path / f"terraform-output-{timestamp}.log")
@@ -353,8 +369,11 @@ class TerraformHelper:
             LOG.error(e.stderr)
             raise TerraformException(str(e))
 
-    def state_rm(self, resource: str) -> None:
-        """Remove a resource from Terraform state."""
+    def state_rm(self, *resources: str) -> None:
+        """Remove resources from Terraform state in a single call."""
+        if not resources:
+            return
+        self._output = None
         os_env = os.environ.copy()
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
         tf_log = str(self.path / f"terraform-state-rm-{timestamp}.log")
@@ -364,7 +383,7 @@ class TerraformHelper:
             os_env.update(self.env)
 
         try:
-            cmd = [self.terraform, "state", "rm", resource]
+            cmd = [self.terraform, "state", "rm", *resources]
             LOG.debug(f"Running command {' '.join(cmd)}")
             process = subprocess.run(
                 cmd,
@@ -384,6 +403,7 @@ class TerraformHelper:
 
     def sync(self) -> None:
         """Sync the running state back to the Terraform state file."""
+        self._output = None
         os_env = os.environ.copy()
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
         tf_log = str(self.path / f"terraform-sync-{timestamp}.log")
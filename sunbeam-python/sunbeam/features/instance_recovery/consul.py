@@ -36,6 +36,7 @@ from sunbeam.core.common import (
     BaseStep,
     Result,
     ResultType,
+    cancel_status_background,
     update_config,
     update_status_background,
 )
@@ -213,8 +214,7 @@ class DeployConsulClientStep(BaseStep):
             LOG.debug("Failed to deploy consul client", exc_info=True)
             return Result(ResultType.FAILED, str(e))
         finally:
-            if not task.done():
-                task.cancel()
+            cancel_status_background(task)
 
         return Result(ResultType.COMPLETED)
 
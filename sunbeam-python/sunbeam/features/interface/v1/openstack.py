@@ -34,6 +34,7 @@ from sunbeam.core.common import (
     BaseStep,
     Result,
     ResultType,
+    cancel_status_background,
     delete_config,
     read_config,
     run_plan,
@@ -506,8 +507,7 @@ class UpgradeOpenStackApplicationStep(BaseStep, JujuStepHelper):
             LOG.debug(str(e))
             return Result(ResultType.FAILED, str(e))
         finally:
-            if not task.done():
-                task.cancel()
+            cancel_status_background(task)
 
         return Result(ResultType.COMPLETED)
 
@@ -603,8 +603,7 @@ class EnableOpenStackApplicationStep(
             LOG.warning(str(e))
             return Result(ResultType.FAILED, str(e))
         finally:
-            if not task.done():
-                task.cancel()
+            cancel_status_background(task)
 
         return Result(ResultType.COMPLETED)
 
@@ -733,6 +732,5 @@ class WaitForApplicationsStep(BaseStep):
             LOG.debug("Failed to wait for apps to settle", exc_info=True)
             return Result(ResultType.FAILED, str(e))
         finally:
-            if not task.done():
-                task.cancel()
+            cancel_status_background(task)
         return Result(ResultType.COMPLETED)
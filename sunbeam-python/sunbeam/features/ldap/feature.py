@@ -31,6 +31,7 @@ from sunbeam.core.common import (
     BaseStep,
     Result,
     ResultType,
+    cancel_status_background,
     read_config,
     run_plan,
     update_config,
@@ -201,8 +202,7 @@ class UpdateLDAPDomainStep(BaseStep, JujuStepHelper):
             LOG.warning(str(e))
             return Result(ResultType.FAILED, str(e))
         finally:
-            if not task.done():
-                task.cancel()
+            cancel_status_background(task)
         return Result(ResultType.COMPLETED)
 
 
@@ -274,8 +274,7 @@ class AddLDAPDomainStep(BaseStep, JujuStepHelper):
             LOG.warning(str(e))
             return Result(ResultType.FAILED, str(e))
         finally:
-            if not task.done():
-                task.cancel()
+            cancel_status_background(task)
 
         return Result(ResultType.COMPLETED)
 
@@ -43,6 +43,7 @@ from sunbeam.core.common import (
     BaseStep,
     Result,
     ResultType,
+    cancel_status_background,
     convert_proxy_to_model_configs,
     read_config,
     run_plan,
@@ -179,8 +180,7 @@ class DeployObservabilityStackStep(BaseStep, JujuStepHelper):
             LOG.debug("Failed to deploy Observability Stack", exc_info=True)
             return Result(ResultType.FAILED, str(e))
         finally:
-            if not task.done():
-                task.cancel()
+            cancel_status_background(task)
 
         return Result(ResultType.COMPLETED)
 
@@ -457,6 +457,7 @@ class IntegrateRemoteCosOffersStep(BaseStep, JujuStepHelper):
                         model,
                         relation_pair[0],
                         relation_pair[1],
+                        jhelper=self.jhelper,
                     )
 
         for model in [
@@ -531,6 +532,7 @@ class RemoveRemoteCosOffersStep(BaseStep, JujuStepHelper):
                     model,
                     relation_pair[0],
                     relation_pair[1],
+                    jhelper=self.jhelper,
                 )
 
         for model in [
@@ -509,7 +509,7 @@ def deploy_and_migrate_juju_controller(
     plan3.extend(get_k8s_plans(deployment, jhelper, manifest, accept_defaults))
     run_plan(plan3, console, show_hints)
     # Disconnect all pylibjuju connections before bootstrapping new controller
-    run_sync(jhelper.disconnect())
+    run_sync(jhelper.disconnect(discard=True))
     del jhelper
 
     plan4 = get_juju_bootstrap_plans(deployment, juju_bootstrap_args)
@@ -114,14 +114,20 @@ class MaasClient:
 
         Only list reserved types as it is the only one we are interested in.
         """
+        return self.get_reserved_ip_ranges().get(subnet["id"], [])
+
+    def get_reserved_ip_ranges(self) -> dict[int, list[dict]]:
+        """List reserved ip ranges of all subnets with a single call.
+
+        Return a dict with the subnet id as key and a list of ip ranges as value.
+        """
         ip_ranges_response: list = self._client.ip_ranges.list()  # type: ignore
 
-        subnet_id = subnet["id"]
-        ip_ranges = []
+        ip_ranges = collections.defaultdict(list)
         for ip_range in ip_ranges_response:
-            if ip_range.subnet.id == subnet_id and ip_range.type.value == "reserved":
-                ip_ranges.append(ip_range._data)
-        return ip_ranges
+            if ip_range.type.value == "reserved":
+                ip_ranges[ip_range.subnet.id].append(ip_range._data)
+        return dict(ip_ranges)
 
     def get_dns_servers(self) -> list[str]:
         """Get configured upstream dns."""
@@ -417,9 +423,10 @@ def get_ip_ranges_from_space(client: MaasClient, space: str) -> dict[str, list[d
     Return a dict with the CIDR as key and a list of IP ranges as value.
     """
     subnets = client.get_subnets(space)
+    reserved_ranges = client.get_reserved_ip_ranges()
     ip_ranges = {}
     for subnet in subnets:
-        ranges_raw = client.get_ip_ranges(subnet)
+        ranges_raw = reserved_ranges.get(subnet["id"], [])
         ranges = []
         for ip_range in ranges_raw:
             ranges.append(_convert_raw_ip_range(ip_range))
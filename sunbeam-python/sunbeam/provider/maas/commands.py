@@ -1615,5 +1615,5 @@ def destroy_deployment_cmd(
     plan.append(CleanTerraformPlansStep(deployment))
     run_plan(plan, console, no_hint=False)
     if jhelper:
-        run_sync(jhelper.controller.disconnect())
+        run_sync(jhelper.disconnect(discard=True))
     click.echo("Deployment destroyed.")
@@ -24,6 +24,7 @@ import textwrap
 from pathlib import Path
 from typing import Sequence
 
+from juju.errors import JujuError
 from maas.client import bones  # type: ignore [import-untyped]
 from rich.console import Console
 from rich.status import Status
@@ -728,7 +729,7 @@ class ZoneBalanceCheck(DiagnosticsCheck):
                     zone_role_counts[zone][role] += 1
         LOG.debug(f"{zone_role_counts=!r}")
         unbalanced_roles = []
-        distribution = ""
+        distribution_lines = []
         for role in maas_deployment.RoleTags.values():
             role_any_zone_counts = [
                 zone_role_counts[zone].get(role, 0) for zone in zone_role_counts
@@ -737,10 +738,12 @@ class ZoneBalanceCheck(DiagnosticsCheck):
             min_count = min(role_any_zone_counts)
             if max_count != min_count:
                 unbalanced_roles.append(role)
-            distribution += f"{role}:"
-            for zone, counts in zone_role_counts.items():
-                distribution += f"\n  {zone}={counts.get(role, 0)}"
-            distribution += "\n"
+            distribution_lines.append(f"{role}:")
+            distribution_lines.extend(
+                f"  {zone}={counts.get(role, 0)}"
+                for zone, counts in zone_role_counts.items()
+            )
+        distribution = "\n".join(distribution_lines) + "\n"
 
         if unbalanced_roles:
             diagnostics = textwrap.dedent(
@@ -1361,15 +1364,20 @@ class MaasAddMachinesToClusterdStep(BaseStep):
         if filtered_machines is None or len(filtered_machines) == 0:
             return Result(ResultType.FAILED, "Maas deployment has no machines.")
         clusterd_nodes = self.client.cluster.list_nodes()
+        machines_by_hostname = {
+            machine["hostname"]: machine for machine in filtered_machines
+        }
         nodes_to_update = []
         for node in clusterd_nodes:
-            for machine in filtered_machines:
-                if node["name"] == machine["hostname"]:
-                    filtered_machines.remove(machine)
-                    if sorted(node["role"]) != sorted(machine["roles"]):
-                        nodes_to_update.append((machine["hostname"], machine["roles"]))
+            maas_machine = machines_by_hostname.pop(node["name"], None)
+            if maas_machine is None:
+                continue
+            if sorted(node["role"]) != sorted(maas_machine["roles"]):
+                nodes_to_update.append(
+                    (maas_machine["hostname"], maas_machine["roles"])
+                )
         self.nodes = nodes_to_update
-        self.machines = filtered_machines
+        self.machines = list(machines_by_hostname.values())
         return Result(ResultType.COMPLETED)
 
     def run(self, status: Status | None = None) -> Result:
@@ -1479,15 +1487,27 @@ class MaasDeployMachinesStep(BaseStep):
     def run(self, status: Status | None = None) -> Result:
         """Deploy machines in Juju."""
         model = run_sync(self.jhelper.get_model(self.model))
-        for node in self.nodes_to_deploy:
-            self.update_status(status, f"deploying {node['name']}")
-            LOG.debug(f"Adding machine {node['name']} to model {self.model}")
-            juju_machine = run_sync(
-                self.jhelper.add_machine("system-id=" + node["systemid"], model)
-            )
-            self.client.cluster.update_node_info(
-                node["name"], machineid=int(juju_machine.id)
+        if self.nodes_to_deploy:
+            names = [node["name"] for node in self.nodes_to_deploy]
+            self.update_status(status, f"deploying {', '.join(names)}")
+            LOG.debug(f"Adding machines {names} to model {self.model}")
+            juju_machines = run_sync(
+                self.jhelper.add_machines(
+                    ["system-id=" + node["systemid"] for node in self.nodes_to_deploy],
+                    model,
+                )
             )
+            errors = []
+            for node, juju_machine in zip(self.nodes_to_deploy, juju_machines):
+                if isinstance(juju_machine, JujuError):
+                    errors.append(juju_machine)
+                    continue
+                self.client.cluster.update_node_info(
+                    node["name"], machineid=int(juju_machine.id)
+                )
+            if errors:
+                run_sync(model.disconnect())
+                raise JujuError("; ".join(str(error) for error in errors))
         self.update_status(status, "waiting for machines to deploy")
         for node in self.nodes_to_update:
             LOG.debug(f"Updating machine {node['name']} in model {self.model}")
@@ -1535,15 +1555,16 @@ class MaasDeployInfraMachinesStep(BaseStep):
         if filtered_machines is None or len(filtered_machines) == 0:
             return Result(ResultType.FAILED, "Maas deployment has no infra machines.")
 
-        self.machines_to_deploy = filtered_machines.copy()
         model = run_sync(self.jhelper.get_model(self.model))
         juju_machines = run_sync(self.jhelper.get_machines(model))
         LOG.debug(f"Machines already deployed: {juju_machines}")
 
-        for filtered_machine in filtered_machines:
-            for id, deployed_machine in juju_machines.items():
-                if filtered_machine["hostname"] == deployed_machine.hostname:
-                    self.machines_to_deploy.remove(filtered_machine)
+        deployed_hostnames = {machine.hostname for machine in juju_machines.values()}
+        self.machines_to_deploy = [
+            machine
+            for machine in filtered_machines
+            if machine["hostname"] not in deployed_hostnames
+        ]
 
         run_sync(model.disconnect())
 
@@ -1554,15 +1575,23 @@ class MaasDeployInfraMachinesStep(BaseStep):
     def run(self, status: Status | None = None) -> Result:
         """Deploy machines in Juju."""
         model = run_sync(self.jhelper.get_model(self.model))
-        for machine in self.machines_to_deploy:
-            self.update_status(status, f"deploying {machine['hostname']}")
-            LOG.debug(f"Adding machine {machine['hostname']} to model {self.model}")
-            run_sync(
-                self.jhelper.add_machine(
-                    "system-id=" + machine["system_id"], model, JUJU_BASE
-                )
+        names = [machine["hostname"] for machine in self.machines_to_deploy]
+        self.update_status(status, f"deploying {', '.join(names)}")
+        LOG.debug(f"Adding machines {names} to model {self.model}")
+        juju_machines = run_sync(
+            self.jhelper.add_machines(
+                [
+                    "system-id=" + machine["system_id"]
+                    for machine in self.machines_to_deploy
+                ],
+                model,
+                JUJU_BASE,
             )
+        )
         run_sync(model.disconnect())
+        errors = [str(m) for m in juju_machines if isinstance(m, JujuError)]
+        if errors:
+            raise JujuError("; ".join(errors))
 
         try:
             run_sync(self.jhelper.wait_all_machines_deployed(self.model))
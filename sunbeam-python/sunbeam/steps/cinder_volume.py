@@ -27,6 +27,7 @@ from sunbeam.clusterd.service import (
 from sunbeam.core.common import BaseStep, Result, ResultType, Role, read_config
 from sunbeam.core.deployment import Deployment, Networks
 from sunbeam.core.juju import (
+    SNAPSHOT_MAX_AGE,
     ApplicationNotFoundException,
     JujuHelper,
     run_sync,
@@ -115,41 +116,43 @@ class DeployCinderVolumeApplicationStep(DeployMachineApplicationStep):
     def extra_tfvars(self) -> dict:
         """Extra terraform vars to pass to terraform apply."""
         storage_nodes = self.client.cluster.list_nodes_by_role("storage")
+        management_space = self.deployment.get_space(Networks.MANAGEMENT)
+        internal_space = self.deployment.get_space(Networks.INTERNAL)
         tfvars: dict[str, Any] = {
             "endpoint_bindings": [
                 {
-                    "space": self.deployment.get_space(Networks.MANAGEMENT),
+                    "space": management_space,
                 },
                 {
                     "endpoint": "amqp",
-                    "space": self.deployment.get_space(Networks.INTERNAL),
+                    "space": internal_space,
                 },
                 {
                     "endpoint": "database",
-                    "space": self.deployment.get_space(Networks.INTERNAL),
+                    "space": internal_space,
                 },
                 {
                     "endpoint": "cinder-volume",
-                    "space": self.deployment.get_space(Networks.MANAGEMENT),
+                    "space": management_space,
                 },
                 {
                     "endpoint": "identity-credentials",
-                    "space": self.deployment.get_space(Networks.INTERNAL),
+                    "space": internal_space,
                 },
                 {
                     # relation to cinder-api
                     "endpoint": "storage-backend",
-                    "space": self.deployment.get_space(Networks.INTERNAL),
+                    "space": internal_space,
                 },
             ],
             "cinder_volume_ceph_endpoint_bindings": [
                 {
-                    "space": self.deployment.get_space(Networks.MANAGEMENT),
+                    "space": management_space,
                 },
                 {
                     # relation between hypervisor and cinder-volume-ceph
                     # providing credentials to access Ceph
-                    "space": self.deployment.get_space(Networks.MANAGEMENT),
+                    "space": management_space,
                     "endpoint": "ceph-access",
                 },
                 {
@@ -282,26 +285,28 @@ class CheckCinderVolumeDistributionStep(BaseStep):
         if Role.STORAGE.name.lower() not in node_info.get("role", ""):
             LOG.debug("Node %s is not a storage node", self.node)
             return Result(ResultType.SKIPPED)
-        model = run_sync(self.jhelper.get_model(self.model))
+        snapshot = run_sync(
+            self.jhelper.get_model_snapshot(self.model, max_age=SNAPSHOT_MAX_AGE)
+        )
         try:
-            app = run_sync(self.jhelper.get_application(self._APPLICATION, model))
+            units = snapshot.units(self._APPLICATION)
         except ApplicationNotFoundException:
             LOG.debug("Failed to get application", exc_info=True)
-            run_sync(model.disconnect())
             return Result(
                 ResultType.SKIPPED,
                 f"Application {self._APPLICATION} has not been deployed yet",
             )
 
-        for unit in app.units:
-            if unit.machine.id == str(node_info.get("machineid")):
-                LOG.debug("Unit %s is running on node %s", unit.name, self.node)
-                break
-        else:
+        machine_id = str(node_info.get("machineid"))
+        unit_name = next(
+            (name for name, unit in units.items() if unit["machine"] == machine_id),
+            None,
+        )
+        if unit_name is None:
             LOG.debug("No %s units found on %s", self._APPLICATION, self.node)
-            run_sync(model.disconnect())
             return Result(ResultType.SKIPPED)
-        run_sync(model.disconnect())
+        LOG.debug("Unit %s is running on node %s", unit_name, self.node)
+
         nb_storage_nodes = len(self.client.cluster.list_nodes_by_role("storage"))
         if nb_storage_nodes == 1 and not self.force:
             return Result(
@@ -351,15 +356,19 @@ class DestroyCinderVolumeApplicationStep(DestroyMachineApplicationStep):
             LOG.debug(f"Failed to list terraform state: {str(e)}")
             return Result(ResultType.FAILED, "Failed to list terraform state")
 
-        for resource in resources:
-            if "integration" in resource:
-                try:
-                    self.tfhelper.state_rm(resource)
-                except TerraformException as e:
-                    LOG.debug(f"Failed to remove resource {resource}: {str(e)}")
-                    return Result(
-                        ResultType.FAILED,
-                        f"Failed to remove resource {resource} from state",
-                    )
+        integrations = [
+            resource
+            for resource in resources
+            if resource.startswith("juju_integration.")
+        ]
+        if integrations:
+            try:
+                self.tfhelper.state_rm(*integrations)
+            except TerraformException as e:
+                LOG.debug(f"Failed to remove resources {integrations}: {str(e)}")
+                return Result(
+                    ResultType.FAILED,
+                    f"Failed to remove resources {', '.join(integrations)} from state",
+                )
 
         return super().run(status)
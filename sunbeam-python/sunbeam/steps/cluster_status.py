@@ -160,8 +160,8 @@ class ClusterStatusStep(abc.ABC, BaseStep):
             status[node] = _status.get("status")
         return status
 
-    def _get_application_status_per_machine(self, model: str) -> dict:
-        """Return status of every units of applications in a given model.
+    def _get_application_status_per_machine(self, model_status: dict) -> dict:
+        """Return status of every units of applications in a model status.
 
         <machine_id>:
             applications:
@@ -170,8 +170,7 @@ class ClusterStatusStep(abc.ABC, BaseStep):
                     status: <status>
         """
         machine_status: dict = {}
-        status = run_sync(self.jhelper.get_model_status(model))
-        for app, app_status in status["applications"].items():
+        for app, app_status in model_status["applications"].items():
             for unit, unit_status in app_status["units"].items():
                 _machine_pointer = machine_status.setdefault(
                     unit_status["machine"], {"applications": {}}
@@ -182,16 +181,15 @@ class ClusterStatusStep(abc.ABC, BaseStep):
                 }
         return machine_status
 
-    def _get_machines_status(self, model: str) -> dict:
-        """Return status of every machine in a given model.
+    def _get_machines_status(self, model_status: dict) -> dict:
+        """Return status of every machine in a model status.
 
         <machine_id>:
             name: <machine_hostname>
             status: <status>
         """
         machines_status = {}
-        status = run_sync(self.jhelper.get_model_status(model))
-        for machine, machine_status in status["machines"].items():
+        for machine, machine_status in model_status["machines"].items():
             machine_name = machine_status.get("hostname")
             if not machine_name:
                 machine_name = machine_status.get("dns-name")
@@ -245,13 +243,13 @@ class ClusterStatusStep(abc.ABC, BaseStep):
         status = {}
         for model in self.models():
             try:
-                _status_model = self._get_machines_status(model)
+                model_status = run_sync(self.jhelper.get_model_status(model))
             except ModelNotFoundException as e:
                 LOG.debug(f"Model {model} not found", exc_info=True)
                 raise SunbeamException("Failed to query model status.") from e
             status[model] = merge_dict(
-                _status_model,
-                self._get_application_status_per_machine(model),
+                self._get_machines_status(model_status),
+                self._get_application_status_per_machine(model_status),
             )
         self._update_microcluster_status(status, self._get_microcluster_status())
         return self._to_status(status, self.applications_to_columns())
@@ -17,7 +17,6 @@ import json
 import logging
 import traceback
 
-import openstack
 from rich.status import Status
 
 from sunbeam.clusterd.client import Client
@@ -38,7 +37,6 @@ from sunbeam.core.juju import (
 )
 from sunbeam.core.manifest import Manifest
 from sunbeam.core.openstack import OPENSTACK_MODEL
-from sunbeam.core.openstack_api import remove_hypervisor
 from sunbeam.core.steps import (
     AddMachineUnitsStep,
     DeployMachineApplicationStep,
@@ -351,6 +349,11 @@ class RemoveHypervisorUnitStep(BaseStep, JujuStepHelper):
         except (ApplicationNotFoundException, TimeoutException) as e:
             LOG.warning(str(e))
             return Result(ResultType.FAILED, str(e))
+        # imported here, the openstack SDK is slow to import
+        import openstack
+
+        from sunbeam.core.openstack_api import remove_hypervisor
+
         try:
             remove_hypervisor(self.name, self.jhelper)
         except openstack.exceptions.SDKException as e:
@@ -583,15 +583,14 @@ class _CommonK8SStepMixin:
                 f"Application {self._SUBSTRATE} has not been deployed yet",
             )
 
-        for unit in app.units:
-            if unit.machine.id == str(node_info.get("machineid")):
-                LOG.debug("Unit %s is running on node %s", unit.name, self.node)
-                self.unit = unit
-                break
-        else:
+        machine_id = str(node_info.get("machineid"))
+        unit = next((u for u in app.units if u.machine.id == machine_id), None)
+        if unit is None:
             LOG.debug("No %s units found on %s", self._SUBSTRATE, self.node)
             run_sync(model.disconnect())
             return Result(ResultType.SKIPPED)
+        LOG.debug("Unit %s is running on node %s", unit.name, self.node)
+        self.unit = unit
 
         run_sync(model.disconnect())
         try:
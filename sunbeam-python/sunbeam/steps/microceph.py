@@ -26,6 +26,7 @@ from sunbeam.core import questions
 from sunbeam.core.common import BaseStep, Result, ResultType, Role, SunbeamException
 from sunbeam.core.deployment import Deployment, Networks
 from sunbeam.core.juju import (
+    SNAPSHOT_MAX_AGE,
     ActionFailedException,
     ApplicationNotFoundException,
     JujuHelper,
@@ -538,27 +539,28 @@ class CheckMicrocephDistributionStep(BaseStep):
         if Role.STORAGE.name.lower() not in node_info.get("role", ""):
             LOG.debug("Node %s is not a storage node", self.node)
             return Result(ResultType.SKIPPED)
-        model = run_sync(self.jhelper.get_model(self.model))
+        snapshot = run_sync(
+            self.jhelper.get_model_snapshot(self.model, max_age=SNAPSHOT_MAX_AGE)
+        )
         try:
-            app = run_sync(self.jhelper.get_application(self._APPLICATION, model))
+            units = snapshot.units(self._APPLICATION)
         except ApplicationNotFoundException:
             LOG.debug("Failed to get application", exc_info=True)
-            run_sync(model.disconnect())
             return Result(
                 ResultType.SKIPPED,
                 f"Application {self._APPLICATION} has not been deployed yet",
             )
 
-        for unit in app.units:
-            if unit.machine.id == str(node_info.get("machineid")):
-                LOG.debug("Unit %s is running on node %s", unit.name, self.node)
-                break
-        else:
-            run_sync(model.disconnect())
+        machine_id = str(node_info.get("machineid"))
+        unit_name = next(
+            (name for name, unit in units.items() if unit["machine"] == machine_id),
+            None,
+        )
+        if unit_name is None:
             LOG.debug("No %s units found on %s", self._APPLICATION, self.node)
             return Result(ResultType.SKIPPED)
+        LOG.debug("Unit %s is running on node %s", unit_name, self.node)
 
-        run_sync(model.disconnect())
         nb_storage_nodes = len(self.client.cluster.list_nodes_by_role("storage"))
         if nb_storage_nodes == 1 and not self.force:
             return Result(
@@ -616,15 +618,19 @@ class DestroyMicrocephApplicationStep(DestroyMachineApplicationStep):
             LOG.debug(f"Failed to list terraform state: {str(e)}")
             return Result(ResultType.FAILED, "Failed to list terraform state")
 
-        for resource in resources:
-            if "integration" in resource:
-                try:
-                    self.tfhelper.state_rm(resource)
-                except TerraformException as e:
-                    LOG.debug(f"Failed to remove resource {resource}: {str(e)}")
-                    return Result(
-                        ResultType.FAILED,
-                        f"Failed to remove resource {resource} from state",
-                    )
+        integrations = [
+            resource
+            for resource in resources
+            if resource.startswith("juju_integration.")
+        ]
+        if integrations:
+            try:
+                self.tfhelper.state_rm(*integrations)
+            except TerraformException as e:
+                LOG.debug(f"Failed to remove resources {integrations}: {str(e)}")
+                return Result(
+                    ResultType.FAILED,
+                    f"Failed to remove resources {', '.join(integrations)} from state",
+                )
 
         return super().run(status)
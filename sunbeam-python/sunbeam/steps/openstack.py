@@ -30,6 +30,7 @@ from sunbeam.core.common import (
     BaseStep,
     Result,
     ResultType,
+    cancel_status_background,
     convert_proxy_to_model_configs,
     get_host_total_cores,
     get_host_total_ram,
@@ -584,8 +585,7 @@ class DeployControlPlaneStep(BaseStep, JujuStepHelper):
             LOG.warning(str(e))
             return Result(ResultType.FAILED, str(e))
         finally:
-            if not task.done():
-                task.cancel()
+            cancel_status_background(task)
 
         return Result(ResultType.COMPLETED)
 
@@ -685,8 +685,7 @@ class ReapplyOpenStackTerraformPlanStep(BaseStep, JujuStepHelper):
             LOG.debug(str(e))
             return Result(ResultType.FAILED, str(e))
         finally:
-            if not task.done():
-                task.cancel()
+            cancel_status_background(task)
 
         return Result(ResultType.COMPLETED)
 
@@ -83,4 +83,4 @@ class UpgradeCoordinator:
     def run_plan(self, show_hints: bool = False) -> None:
         """Execute the upgrade plan."""
         plan = self.get_plan()
-        run_plan(plan, console, show_hints)
+        run_plan(plan, console, show_hints, prefetch=True)
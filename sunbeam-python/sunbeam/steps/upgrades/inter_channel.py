@@ -24,6 +24,7 @@ from sunbeam.core.common import (
     BaseStep,
     Result,
     ResultType,
+    cancel_status_background,
     run_plan,
     update_status_background,
 )
@@ -152,8 +153,7 @@ class BaseUpgrade(BaseStep, JujuStepHelper):
             LOG.debug(str(e))
             return Result(ResultType.FAILED, str(e))
         finally:
-            if not task.done():
-                task.cancel()
+            cancel_status_background(task)
 
         return Result(ResultType.COMPLETED)
 
@@ -189,10 +189,13 @@ class UpgradeControlPlane(BaseUpgrade):
 
     def upgrade_tasks(self, status: Status | None = None) -> Result:
         """Perform the upgrade tasks."""
+        # Charms deployed do not change across steps, fetch the status once
+        model_status = run_sync(self.jhelper.get_model_status_full(self.model))
+
         # Step 1: Upgrade mysql charms
         LOG.debug("Upgrading Mysql charms")
         charms = list(MYSQL_CHARMS_K8S.keys())
-        apps = self.get_apps_filter_by_charms(self.model, charms)
+        apps = self.get_apps_filter_by_charms(self.model, charms, model_status)
         result = self.upgrade_applications(
             apps, charms, self.model, self.tfhelper, self.config, 1200, status
         )
@@ -206,7 +209,7 @@ class UpgradeControlPlane(BaseUpgrade):
             + list(OVN_CHARMS_K8S.keys())  # noqa: W503
             + list(OPENSTACK_CHARMS_K8S.keys())  # noqa: W503
         )
-        apps = self.get_apps_filter_by_charms(self.model, charms)
+        apps = self.get_apps_filter_by_charms(self.model, charms, model_status)
         result = self.upgrade_applications(
             apps,
             charms,
@@ -225,7 +228,7 @@ class UpgradeControlPlane(BaseUpgrade):
         charms = (
             self.deployment.get_feature_manager().get_all_charms_in_openstack_plan()
         )
-        apps = self.get_apps_filter_by_charms(self.model, charms)
+        apps = self.get_apps_filter_by_charms(self.model, charms, model_status)
         result = self.upgrade_applications(
             apps,
             charms,
@@ -507,7 +510,7 @@ class ChannelUpgradeCoordinator(UpgradeCoordinator):
     def run_plan(self, show_hints: bool = False) -> None:
         """Execute the upgrade plan."""
         plan = self.get_plan()
-        run_plan(plan, console, show_hints)
+        run_plan(plan, console, show_hints, prefetch=True)
 
 
 class ValidationCheck(BaseStep):
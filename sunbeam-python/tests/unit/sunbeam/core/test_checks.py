@@ -17,7 +17,10 @@ import base64
 import grp
 import json
 import os
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
+
+import click
+import pytest
 
 from sunbeam.core import checks
 
@@ -353,3 +356,46 @@ class TestLxdControllerRegistrationCheck:
 
         assert result is False
         assert "Missing Juju controller on LXD" in check.message
+
+
+class TestRunPreflightChecks:
+    def _check(self, result, message="", independent=False):
+        check = Mock(description="check", message=message, independent=independent)
+        check.name = "check"
+        check.run.return_value = result
+        return check
+
+    def test_run_all_passed(self):
+        preflight_checks = [self._check(True), self._check(True)]
+        checks.run_preflight_checks(preflight_checks, MagicMock())
+        for check in preflight_checks:
+            check.run.assert_called_once_with()
+
+    def test_run_stops_at_first_failure(self):
+        preflight_checks = [
+            self._check(True),
+            self._check(False, "first failure"),
+            self._check(False, "second failure"),
+        ]
+        with pytest.raises(click.ClickException, match="first failure"):
+            checks.run_preflight_checks(preflight_checks, MagicMock())
+        preflight_checks[2].run.assert_not_called()
+
+    def test_run_independent_checks_all_complete(self):
+        preflight_checks = [
+            self._check(True, independent=True),
+            self._check(False, "first failure", independent=True),
+            self._check(False, "second failure", independent=True),
+            self._check(True),
+        ]
+        with pytest.raises(click.ClickException, match="first failure"):
+            checks.run_preflight_checks(preflight_checks, MagicMock())
+        for check in preflight_checks[:3]:
+            check.run.assert_called_once_with()
+        preflight_checks[3].run.assert_not_called()
+
+    def test_run_raises_check_exception(self):
+        failing = self._check(True)
+        failing.run.side_effect = ValueError("boom")
+        with pytest.raises(ValueError, match="boom"):
+            checks.run_preflight_checks([self._check(True), failing], MagicMock())
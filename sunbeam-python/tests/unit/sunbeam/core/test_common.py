@@ -13,15 +13,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import functools
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import click
 import pytest
 
 from sunbeam.clusterd.service import ClusterServiceUnavailableException
-from sunbeam.core.common import Role, validate_roles
+from sunbeam.core.common import (
+    Result,
+    ResultType,
+    Role,
+    cancel_status_background,
+    run_plan,
+    update_status_background,
+    validate_roles,
+)
 from sunbeam.core.deployment import Deployment
+from sunbeam.core.juju import JujuHelper, run_sync
 
 
 @pytest.fixture()
@@ -183,3 +193,44 @@ def test_validate_roles():
     multiple_comma_separated_roles = ("control,compute", "storage,compute")
     result = validate_roles(Mock(), Mock(), multiple_comma_separated_roles)
     assert not set(result) ^ all_roles
+
+
+def test_cancel_status_background_from_another_thread():
+    step = Mock(status="Deploying: ")
+    status = Mock()
+    queue: asyncio.Queue[str] = asyncio.Queue(1)
+    # The task is created on the run_sync loop thread, not on this thread
+    task = run_sync(update_status_background(step, ["app1"], queue, status))
+    cancel_status_background(task)
+
+    async def _wait():
+        await asyncio.wait([task], timeout=5)
+
+    run_sync(_wait())
+    assert task.done()
+    status.update.assert_called_with("Deploying: all services are online")
+    # Cancelling a finished task is a no-op
+    cancel_status_background(task)
+
+
+def _plan_step(jhelper):
+    step = Mock(jhelper=jhelper, model="openstack")
+    step.name = "step"
+    step.has_prompts.return_value = False
+    step.is_skip.return_value = Result(ResultType.SKIPPED)
+    return step
+
+
+def test_run_plan_does_not_prefetch_by_default():
+    jhelper = Mock(spec=JujuHelper)
+    run_plan([_plan_step(jhelper)], MagicMock())
+    jhelper.prefetch.assert_not_called()
+
+
+def test_run_plan_prefetch_failure_ignored():
+    jhelper = Mock(spec=JujuHelper)
+    jhelper.prefetch.side_effect = ValueError("boom")
+    step = _plan_step(jhelper)
+    results = run_plan([step], MagicMock(), prefetch=True)
+    jhelper.prefetch.assert_called_once_with(["openstack"])
+    assert results[step.__class__.__name__].result_type == ResultType.SKIPPED
@@ -82,6 +82,20 @@ class TestOpenStackAPI:
         assert sunbeam.core.openstack_api.guests_on_hypervisor("hyper1", None) == [1]
         conn.compute.servers.assert_called_once_with(all_projects=True, host="hyper1")
 
+    def test_guests_on_hypervisor_statuses(self, get_admin_connection):
+        conn = Mock()
+        get_admin_connection.return_value = conn
+        error, active, shutoff = (
+            Mock(status="ERROR"),
+            Mock(status="ACTIVE"),
+            Mock(status="SHUTOFF"),
+        )
+        conn.compute.servers.return_value = [error, active, shutoff]
+        assert sunbeam.core.openstack_api.guests_on_hypervisor(
+            "hyper1", None, statuses=["ERROR", "MIGRATING", "SHUTOFF"]
+        ) == [error, shutoff]
+        conn.compute.servers.assert_called_once_with(all_projects=True, host="hyper1")
+
     def test_remove_compute_service(self):
         service1 = Mock(binary="nova-compute", host="hyper1")
         conn = Mock()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import functools
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -144,3 +145,59 @@ class TestTerraformHelper:
         # Below are asserts for charm config parameters
         # Assert config values coming from extra_tfvars and in manifest
         assert applied_tfvars.get("glance-config") == {"ceph-osd-replication-count": 5}
+
+    def test_write_tfvars(self, mocker, snap, tmp_path):
+        mocker.patch.object(terraform_mod, "Snap", return_value=snap)
+        tfhelper = terraform_mod.TerraformHelper(tmp_path, "openstack-plan", {})
+        tfvars = {"model": "openstack", "machine_ids": [1, 2], "ranges": {1: "a"}}
+        tfhelper.write_tfvars(tfvars)
+
+        written = json.loads((tmp_path / "terraform.tfvars.json").read_text())
+        assert written == {
+            "model": "openstack",
+            "machine_ids": [1, 2],
+            "ranges": {"1": "a"},
+        }
+
+    def test_output_cached_until_apply(self, mocker, snap, run, tmp_path):
+        mocker.patch.object(terraform_mod, "Snap", return_value=snap)
+        tfhelper = terraform_mod.TerraformHelper(tmp_path, "openstack-plan", {})
+        run.return_value = Mock(
+            stdout=json.dumps({"keystone-offer-url": {"value": "admin/ks"}}),
+            stderr="",
+        )
+
+        output = tfhelper.output()
+        assert output == {"keystone-offer-url": "admin/ks"}
+        output["keystone-offer-url"] = None
+        assert tfhelper.output() == {"keystone-offer-url": "admin/ks"}
+        assert run.call_count == 1
+
+        tfhelper.apply()
+        tfhelper.output()
+        assert run.call_count == 3
+
+    def test_output_cache_dropped_on_backend_change(self, mocker, snap, run, tmp_path):
+        mocker.patch.object(terraform_mod, "Snap", return_value=snap)
+        tfhelper = terraform_mod.TerraformHelper(tmp_path, "openstack-plan", {})
+        mocker.patch.object(tfhelper, "write_terraformrc")
+        write_backend_tf = mocker.patch.object(tfhelper, "write_backend_tf")
+        run.return_value = Mock(
+            stdout=json.dumps({"keystone-offer-url": {"value": "admin/ks"}}),
+            stderr="",
+        )
+
+        tfhelper.output()
+        write_backend_tf.return_value = False
+        tfhelper.init()
+        tfhelper.output()
+        assert run.call_count == 2
+
+        write_backend_tf.return_value = True
+        tfhelper.init()
+        tfhelper.output()
+        assert run.call_count == 4
+
+        tfhelper.reload_env({"TF_VAR_endpoint": "https://10.0.0.1"})
+        tfhelper.output()
+        assert run.call_count == 5
@@ -256,15 +256,18 @@ class TestRemoveGrafanaAgentStep:
 
 class TestIntegrateRemoteCosOffersStep:
     def test_run(self, deployment, jhelper, observabilityfeature, snap, run):
-        observabilityfeature.grafana_offer_url = "remotecos:admin/grafana"
-        observabilityfeature.prometheus_offer_url = "remotecos:admin/prometheus"
-        observabilityfeature.loki_offer_url = "remotecos:admin/loki"
+        observabilityfeature.grafana_offer_url = "remotecos:admin/cos.grafana"
+        observabilityfeature.prometheus_offer_url = "remotecos:admin/cos.prometheus"
+        observabilityfeature.loki_offer_url = "remotecos:admin/cos.loki"
         deployment.openstack_machines_model = "test-model"
         step = observability_feature.IntegrateRemoteCosOffersStep(
             deployment, observabilityfeature, jhelper
         )
 
         result = step.run()
+        # Offers from another controller go through the juju client
+        jhelper.integrate_endpoints.assert_not_called()
+        assert run.call_count == 6
         jhelper.wait_application_ready.assert_called()
         assert result.result_type == ResultType.COMPLETED
 
@@ -273,9 +276,9 @@ class TestIntegrateRemoteCosOffersStep:
     ):
         jhelper.wait_application_ready.side_effect = TimeoutException("timed out")
 
-        observabilityfeature.grafana_offer_url = "remotecos:admin/grafana"
-        observabilityfeature.prometheus_offer_url = "remotecos:admin/prometheus"
-        observabilityfeature.loki_offer_url = "remotecos:admin/loki"
+        observabilityfeature.grafana_offer_url = "remotecos:admin/cos.grafana"
+        observabilityfeature.prometheus_offer_url = "remotecos:admin/cos.prometheus"
+        observabilityfeature.loki_offer_url = "remotecos:admin/cos.loki"
         deployment.openstack_machines_model = "test-model"
         step = observability_feature.IntegrateRemoteCosOffersStep(
             deployment, observabilityfeature, jhelper
@@ -309,7 +312,13 @@ class TestRemoveRemoteCosOffersStep:
         )
 
         result = step.run()
-        run.assert_called_once()
+        run.assert_not_called()
+        jhelper.remove_relation.assert_called_once_with(
+            "openstack",
+            "grafana-agent:logging-consumer",
+            "loki:loki_push_api",
+            force=False,
+        )
         jhelper.wait_application_ready.assert_called()
         assert result.result_type == ResultType.COMPLETED
 
@@ -351,7 +360,7 @@ class TestRemoveRemoteCosOffersStep:
         )
 
         result = step.run()
-        run.assert_called_once()
+        jhelper.remove_relation.assert_called_once()
         jhelper.wait_application_ready.assert_called()
         assert result.result_type == ResultType.FAILED
         assert result.message == "timed out"
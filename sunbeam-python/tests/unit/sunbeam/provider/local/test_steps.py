@@ -218,6 +218,7 @@ class TestLocalClusterStatusStep:
         actual_status = step._compute_status()
 
         assert expected_status == actual_status
+        jhelper.get_model_status.assert_called_once_with(model)
 
     def test_compute_status_with_missing_hostname_in_model_status(
         self, deployment, jhelper
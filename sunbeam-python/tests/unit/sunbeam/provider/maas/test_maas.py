@@ -17,8 +17,10 @@ from ssl import SSLError
 from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
+from juju.errors import JujuError
 from maas.client.bones import CallError
 
+import sunbeam.provider.maas.client as maas_client
 import sunbeam.provider.maas.steps as maas_steps
 from sunbeam.core.checks import DiagnosticResultType
 from sunbeam.core.deployment import Networks
@@ -550,6 +552,10 @@ class TestZoneBalanceCheck:
         result = check.run()
         assert result.passed is DiagnosticResultType.WARNING
         assert result.message and "compute distribution is unbalanced" in result.message
+        assert result.diagnostics and (
+            "compute:\n  zone1=1\n  zone2=0\nstorage:\n  zone1=1\n  zone2=1\n"
+            in result.diagnostics
+        )
 
 
 class TestIpRangesCheck:
@@ -664,6 +670,34 @@ class TestIpRangesCheck:
         get_ip_ranges_from_space_mock.assert_any_call(client, "internal_space")
 
 
+class TestGetIpRangesFromSpace:
+    def _ip_range(self, subnet_id, type_, start):
+        return Mock(
+            subnet=Mock(id=subnet_id),
+            type=Mock(value=type_),
+            _data={"comment": "", "start_ip": start, "end_ip": start},
+        )
+
+    def test_ranges_listed_once(self):
+        client = maas_client.MaasClient.__new__(maas_client.MaasClient)
+        client._client = Mock()
+        client._client.subnets.list.return_value = [
+            Mock(space="public", _data={"id": 1, "cidr": "10.0.0.0/24"}),
+            Mock(space="public", _data={"id": 2, "cidr": "10.0.1.0/24"}),
+            Mock(space="other", _data={"id": 3, "cidr": "10.0.2.0/24"}),
+        ]
+        client.get_space = Mock(return_value={"name": "public"})
+        client._client.ip_ranges.list.return_value = [
+            self._ip_range(1, "reserved", "10.0.0.10"),
+            self._ip_range(1, "dynamic", "10.0.0.20"),
+            self._ip_range(3, "reserved", "10.0.2.10"),
+        ]
+        assert maas_client.get_ip_ranges_from_space(client, "public") == {
+            "10.0.0.0/24": [{"label": "", "start": "10.0.0.10", "end": "10.0.0.10"}]
+        }
+        client._client.ip_ranges.list.assert_called_once()
+
+
 class TestMaasBootstrapJujuStep:
     def test_is_skip_with_no_machines(self, snap, mocker):
         maas_client = Mock()
@@ -874,6 +908,29 @@ class TestMaasAddMachinesToClusterdStep:
         result = maas_add_machines_to_clusterd_step.is_skip()
         assert result.result_type == ResultType.COMPLETED
 
+    def test_is_skip_with_existing_nodes(
+        self, mocker, maas_add_machines_to_clusterd_step
+    ):
+        machine3 = {"hostname": "machine3", "roles": [RoleTags.STORAGE.value]}
+        mocker.patch(
+            "sunbeam.provider.maas.client.list_machines",
+            return_value=[
+                {"hostname": "machine1", "roles": [RoleTags.CONTROL.value]},
+                {"hostname": "machine2", "roles": [RoleTags.COMPUTE.value]},
+                machine3,
+            ],
+        )
+        maas_add_machines_to_clusterd_step.client.cluster.list_nodes.return_value = [
+            {"name": "machine1", "role": [RoleTags.CONTROL.value]},
+            {"name": "machine2", "role": [RoleTags.CONTROL.value]},
+        ]
+        result = maas_add_machines_to_clusterd_step.is_skip()
+        assert result.result_type == ResultType.COMPLETED
+        assert maas_add_machines_to_clusterd_step.machines == [machine3]
+        assert maas_add_machines_to_clusterd_step.nodes == [
+            ("machine2", [RoleTags.COMPUTE.value])
+        ]
+
     def test_run_with_no_machines_and_nodes(self, maas_add_machines_to_clusterd_step):
         maas_add_machines_to_clusterd_step.machines = None
         maas_add_machines_to_clusterd_step.nodes = None
@@ -968,13 +1025,38 @@ class TestMaasDeployMachinesStep:
                 "2": Mock(hostname="test_node4", id=2),
             }
         )
+        maas_deploy_machines_step.jhelper.add_machines.return_value = [
+            Mock(id=3),
+            Mock(id=4),
+        ]
         result = maas_deploy_machines_step.run()
         assert result.result_type == ResultType.COMPLETED
         assert maas_deploy_machines_step.client.cluster.update_node_info.call_count == 4
+        maas_deploy_machines_step.jhelper.add_machines.assert_called_once()
+        maas_deploy_machines_step.client.cluster.update_node_info.assert_any_call(
+            "test_node2", machineid=4
+        )
         assert (
             maas_deploy_machines_step.jhelper.wait_all_machines_deployed.call_count == 1
         )
 
+    def test_run_partial_failure(self, maas_deploy_machines_step):
+        maas_deploy_machines_step.nodes_to_deploy = [
+            {"name": "test_node1", "systemid": "1st"},
+            {"name": "test_node2", "systemid": "2nd"},
+        ]
+        maas_deploy_machines_step.nodes_to_update = []
+        maas_deploy_machines_step.jhelper.add_machines.return_value = [
+            JujuError("Error adding machine system-id=1st: boom"),
+            Mock(id=4),
+        ]
+        with pytest.raises(JujuError, match="system-id=1st: boom"):
+            maas_deploy_machines_step.run()
+        maas_deploy_machines_step.client.cluster.update_node_info.assert_called_once_with(
+            "test_node2", machineid=4
+        )
+        maas_deploy_machines_step.jhelper.wait_all_machines_deployed.assert_not_called()
+
 
 class TestMaasDeployInfraMachinesStep:
     @pytest.fixture
@@ -1037,7 +1119,9 @@ class TestMaasDeployInfraMachinesStep:
         ]
         result = maas_deploy_machines_step.run()
         assert result.result_type == ResultType.COMPLETED
-        assert maas_deploy_machines_step.jhelper.add_machine.call_count == 2
+        maas_deploy_machines_step.jhelper.add_machines.assert_called_once()
+        names = maas_deploy_machines_step.jhelper.add_machines.call_args.args[0]
+        assert names == ["system-id=1st", "system-id=2nd"]
         assert (
             maas_deploy_machines_step.jhelper.wait_all_machines_deployed.call_count == 1
         )
@@ -13,14 +13,20 @@
 # limitations under the License.
 
 import unittest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 from sunbeam.clusterd.service import ConfigItemNotFoundException
+from sunbeam.core.common import ResultType
+from sunbeam.core.juju import ModelSnapshot
+from sunbeam.core.steps import DestroyMachineApplicationStep
+from sunbeam.core.terraform import TerraformException
 from sunbeam.steps.cinder_volume import (
     CINDER_VOLUME_APP_TIMEOUT,
     CINDER_VOLUME_UNIT_TIMEOUT,
     AddCinderVolumeUnitsStep,
+    CheckCinderVolumeDistributionStep,
     DeployCinderVolumeApplicationStep,
+    DestroyCinderVolumeApplicationStep,
     RemoveCinderVolumeUnitsStep,
 )
 
@@ -249,3 +255,99 @@ class TestRemoveCinderVolumeUnitsStep(unittest.TestCase):
             self.remove_cinder_volume_units_step.get_unit_timeout(),
             CINDER_VOLUME_UNIT_TIMEOUT,
         )
+
+
+class TestDestroyCinderVolumeApplicationStep(unittest.TestCase):
+    def setUp(self):
+        self.tfhelper = MagicMock()
+        self.destroy_cinder_volume_step = DestroyCinderVolumeApplicationStep(
+            MagicMock(),
+            self.tfhelper,
+            MagicMock(),
+            MagicMock(),
+            "test-model",
+        )
+
+    @patch.object(DestroyMachineApplicationStep, "run")
+    def test_run_removes_integrations_at_once(self, run):
+        self.tfhelper.state_list.return_value = [
+            "juju_application.cinder-volume",
+            "juju_integration.cinder-volume-to-keystone",
+            "juju_integration.cinder-volume-to-amqp",
+            "data.juju_offer.integration",
+        ]
+        self.destroy_cinder_volume_step.run()
+        self.tfhelper.state_rm.assert_called_once_with(
+            "juju_integration.cinder-volume-to-keystone",
+            "juju_integration.cinder-volume-to-amqp",
+        )
+        run.assert_called_once()
+
+    @patch.object(DestroyMachineApplicationStep, "run")
+    def test_run_without_integrations(self, run):
+        self.tfhelper.state_list.return_value = ["juju_application.cinder-volume"]
+        self.destroy_cinder_volume_step.run()
+        self.tfhelper.state_rm.assert_not_called()
+        run.assert_called_once()
+
+    @patch.object(DestroyMachineApplicationStep, "run")
+    def test_run_state_rm_failed(self, run):
+        self.tfhelper.state_list.return_value = ["juju_integration.cinder-volume-amqp"]
+        self.tfhelper.state_rm.side_effect = TerraformException("failed")
+        result = self.destroy_cinder_volume_step.run()
+        self.assertEqual(result.result_type, ResultType.FAILED)
+        run.assert_not_called()
+
+
+class TestCheckCinderVolumeDistributionStep(unittest.TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.cluster.get_node_info.return_value = {
+            "role": ["storage"],
+            "machineid": 1,
+        }
+        self.jhelper = MagicMock()
+        self.jhelper.get_model_snapshot = AsyncMock(
+            return_value=ModelSnapshot(
+                name="test-model",
+                status={
+                    "applications": {
+                        "cinder-volume": {
+                            "units": {
+                                "cinder-volume/0": {"machine": "0"},
+                                "cinder-volume/1": {"machine": "1"},
+                            }
+                        }
+                    }
+                },
+            )
+        )
+        self.check_step = CheckCinderVolumeDistributionStep(
+            self.client, "node1", self.jhelper, "test-model"
+        )
+
+    def test_is_skip_last_storage_node(self):
+        self.client.cluster.list_nodes_by_role.return_value = ["node1"]
+        result = self.check_step.is_skip()
+        self.assertEqual(result.result_type, ResultType.FAILED)
+
+    def test_is_skip_other_storage_nodes(self):
+        self.client.cluster.list_nodes_by_role.return_value = ["node1", "node2"]
+        result = self.check_step.is_skip()
+        self.assertEqual(result.result_type, ResultType.COMPLETED)
+
+    def test_is_skip_no_unit_on_node(self):
+        self.client.cluster.get_node_info.return_value = {
+            "role": ["storage"],
+            "machineid": 2,
+        }
+        result = self.check_step.is_skip()
+        self.assertEqual(result.result_type, ResultType.SKIPPED)
+        self.client.cluster.list_nodes_by_role.assert_not_called()
+
+    def test_is_skip_application_not_deployed(self):
+        self.jhelper.get_model_snapshot.return_value = ModelSnapshot(
+            name="test-model", status={"applications": {}}
+        )
+        result = self.check_step.is_skip()
+        self.assertEqual(result.result_type, ResultType.SKIPPED)
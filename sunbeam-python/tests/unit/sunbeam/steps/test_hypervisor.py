@@ -136,7 +136,7 @@ class TestRemoveHypervisorUnitStep(unittest.TestCase):
         result = step.is_skip()
         assert result.result_type == ResultType.FAILED
 
-    @patch("sunbeam.steps.hypervisor.remove_hypervisor")
+    @patch("sunbeam.core.openstack_api.remove_hypervisor")
     def test_run(self, remove_hypervisor):
         step = RemoveHypervisorUnitStep(
             self.client, self.name, self.jhelper, "test-model"
@@ -146,7 +146,7 @@ class TestRemoveHypervisorUnitStep(unittest.TestCase):
         assert result.result_type == ResultType.COMPLETED
         remove_hypervisor.assert_called_once_with("test-0", self.jhelper)
 
-    @patch("sunbeam.steps.hypervisor.remove_hypervisor")
+    @patch("sunbeam.core.openstack_api.remove_hypervisor")
     def test_run_guests(self, remove_hypervisor):
         step = RemoveHypervisorUnitStep(
             self.client, self.name, self.jhelper, "test-model"
@@ -155,7 +155,7 @@ class TestRemoveHypervisorUnitStep(unittest.TestCase):
         assert result.result_type == ResultType.FAILED
         assert not remove_hypervisor.called
 
-    @patch("sunbeam.steps.hypervisor.remove_hypervisor")
+    @patch("sunbeam.core.openstack_api.remove_hypervisor")
     def test_run_guests_force(self, remove_hypervisor):
         self.jhelper.run_action.return_value = {"result": json.dumps(["1", "2"])}
         step = RemoveHypervisorUnitStep(
@@ -166,7 +166,7 @@ class TestRemoveHypervisorUnitStep(unittest.TestCase):
         assert result.result_type == ResultType.COMPLETED
         remove_hypervisor.assert_called_once_with("test-0", self.jhelper)
 
-    @patch("sunbeam.steps.hypervisor.remove_hypervisor")
+    @patch("sunbeam.core.openstack_api.remove_hypervisor")
     def test_run_application_not_found(self, remove_hypervisor):
         self.jhelper.run_action.return_value = {"result": "[]"}
         self.jhelper.remove_unit.side_effect = ApplicationNotFoundException(
@@ -183,7 +183,7 @@ class TestRemoveHypervisorUnitStep(unittest.TestCase):
         assert result.result_type == ResultType.FAILED
         assert result.message == "Application missing..."
 
-    @patch("sunbeam.steps.hypervisor.remove_hypervisor")
+    @patch("sunbeam.core.openstack_api.remove_hypervisor")
     def test_run_timeout(self, remove_hypervisor):
         self.jhelper.run_action.return_value = {"result": "[]"}
         self.jhelper.wait_application_ready.side_effect = TimeoutException("timed out")
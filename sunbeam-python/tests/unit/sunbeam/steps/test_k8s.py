@@ -20,6 +20,7 @@ import pytest
 
 from sunbeam.clusterd.service import ConfigItemNotFoundException
 from sunbeam.core.common import ResultType
+from sunbeam.core.deployment import Deployment
 from sunbeam.core.juju import (
     ActionFailedException,
     ApplicationNotFoundException,
@@ -34,31 +35,36 @@ from sunbeam.steps.k8s import (
 )
 
 
-@pytest.fixture(autouse=True)
-def mock_run_sync(mocker):
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
+@pytest.fixture(scope="module")
+def run_sync_loop():
+    # Private loop for the patched run_sync, pytest-asyncio's event_loop is
+    # left alone
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
 
-    def run_sync(coro):
-        return loop.run_until_complete(coro)
 
-    mocker.patch("sunbeam.steps.k8s.run_sync", run_sync)
-    yield
-    loop.close()
+@pytest.fixture(autouse=True)
+def mock_run_sync(monkeypatch, run_sync_loop):
+    monkeypatch.setattr("sunbeam.steps.k8s.run_sync", run_sync_loop.run_until_complete)
 
 
 class TestAddK8SCloudStep(unittest.TestCase):
     def __init__(self, methodName: str = "runTest") -> None:
         super().__init__(methodName)
+        self.read_config = patch("sunbeam.steps.k8s.read_config", Mock(return_value={}))
 
     def setUp(self):
-        self.deployment = Mock()
+        self.read_config.start()
+        self.deployment = Mock(spec=Deployment)
+        self.deployment.name = "mydeployment"
         self.cloud_name = f"{self.deployment.name}{K8S_CLOUD_SUFFIX}"
         self.deployment.get_client().cluster.get_config.return_value = "{}"
         self.jhelper = AsyncMock()
 
+    def tearDown(self):
+        self.read_config.stop()
+
     def test_is_skip(self):
         clouds = {}
         self.jhelper.get_clouds.return_value = clouds
@@ -78,9 +84,8 @@ class TestAddK8SCloudStep(unittest.TestCase):
         assert result.result_type == ResultType.SKIPPED
 
     def test_run(self):
-        with patch("sunbeam.steps.k8s.read_config", Mock(return_value={})):
-            step = AddK8SCloudStep(self.deployment, self.jhelper)
-            result = step.run()
+        step = AddK8SCloudStep(self.deployment, self.jhelper)
+        result = step.run()
 
         self.jhelper.add_k8s_cloud.assert_called_with(
             self.cloud_name,
@@ -93,15 +98,20 @@ class TestAddK8SCloudStep(unittest.TestCase):
 class TestAddK8SCredentialStep(unittest.TestCase):
     def __init__(self, methodName: str = "runTest") -> None:
         super().__init__(methodName)
+        self.read_config = patch("sunbeam.steps.k8s.read_config", Mock(return_value={}))
 
     def setUp(self):
-        self.deployment = Mock()
+        self.read_config.start()
+        self.deployment = Mock(spec=Deployment)
         self.deployment.name = "mydeployment"
         self.cloud_name = f"{self.deployment.name}{K8S_CLOUD_SUFFIX}"
         self.credential_name = f"{self.cloud_name}{CREDENTIAL_SUFFIX}"
         self.deployment.get_client().cluster.get_config.return_value = "{}"
         self.jhelper = AsyncMock()
 
+    def tearDown(self):
+        self.read_config.stop()
+
     def test_is_skip(self):
         credentials = {}
         self.jhelper.get_credentials.return_value = credentials
@@ -123,9 +133,8 @@ class TestAddK8SCredentialStep(unittest.TestCase):
         assert result.result_type == ResultType.SKIPPED
 
     def test_run(self):
-        with patch("sunbeam.steps.k8s.read_config", Mock(return_value={})):
-            step = AddK8SCredentialStep(self.deployment, self.jhelper)
-            result = step.run()
+        step = AddK8SCredentialStep(self.deployment, self.jhelper)
+        result = step.run()
 
         self.jhelper.add_k8s_credential.assert_called_with(
             self.cloud_name,
@@ -136,13 +145,10 @@ class TestAddK8SCredentialStep(unittest.TestCase):
 
 
 class TestStoreK8SKubeConfigStep(unittest.TestCase):
-    def __init__(self, methodName: str = "runTest") -> None:
-        super().__init__(methodName)
-
     def setUp(self):
         self.client = Mock(cluster=Mock(get_config=Mock(return_value="{}")))
         self.jhelper = AsyncMock()
-        self.deployment = Mock()
+        self.deployment = Mock(spec=Deployment)
         mock_machine = MagicMock()
         mock_machine.addresses = [
             {"value": "127.0.0.1:16443", "space-name": "management"}